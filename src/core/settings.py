@@ -51,6 +51,9 @@ class Config:
         if os.getenv("QDRANT_PORT"):
             port_value = self._clean_env_value(os.getenv("QDRANT_PORT"))
             self._config['qdrant']['port'] = int(port_value)
+        if os.getenv("QDRANT_GRPC_PORT"):
+            grpc_port_value = self._clean_env_value(os.getenv("QDRANT_GRPC_PORT"))
+            self._config['qdrant']['grpc_port'] = int(grpc_port_value)
         
         # Embeddings
         if os.getenv("EMBED_MODEL"):
@@ -90,6 +93,10 @@ class Config:
     @property
     def qdrant_port(self) -> int:
         return self._config['qdrant']['port']
+
+    @property
+    def qdrant_grpc_port(self) -> int:
+        return self._config['qdrant'].get('grpc_port', 6334)
     
     @property
     def embed_model(self) -> str:
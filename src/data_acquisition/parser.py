@@ -38,6 +38,27 @@ CLEANUP_PATTERNS = [
     (re.compile(r'^[,\-\s]+|[,\-\s]+$'), ''),
 ]
 
+JOB_ROLE_KEY_RE = re.compile(r'\s*/\s*')
+
+# Section-header patterns, compiled once at import. Sorted by length desc so
+# long headers match first (e.g. PROFESSIONAL SUMMARY before SUMMARY).
+SECTION_HEADERS = ["PROFESSIONAL EXPERIENCE", "TECHNICAL SKILLS", "PROFESSIONAL SUMMARY", "SUMMARY"]
+
+# Captures: Group 1 = Header, Group 2 = The rest (for merged headers like
+# 'PROFESSIONAL EXPERIENCECONFIDENTIAL')
+MERGED_HEADER_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, SECTION_HEADERS)) + r")\s*(.+)$", re.IGNORECASE
+)
+
+# We strip trailing colons before matching, so the patterns don't need to handle them
+SECTION_PATTERNS = [
+    (re.compile(r"^(?:PROFESSIONAL\s+)?SUMMARY$", re.IGNORECASE), "SUMMARY"),
+    (re.compile(r"^TECHNICAL\s+SKILLS$", re.IGNORECASE), "TECHNICAL SKILLS"),
+    (re.compile(r"^PROFESSIONAL\s+EXPERIENCE$", re.IGNORECASE), "PROFESSIONAL EXPERIENCE")
+]
+
+TRAILING_COLON_RE = re.compile(r"\s*:\s*$")
+
 
 def remove_resume_from_role(role: str) -> str:
     """
@@ -96,11 +117,26 @@ def normalize_job_role(role: str) -> str:
     return normalized.strip()
 
 
+def job_role_key(normalized_role: str) -> str:
+    """
+    Canonical lookup key for a normalized job role: slash spacing collapsed
+    and lowercased, so "sap pp / mm" and "sap pp/mm" map to the same key.
+
+    Args:
+        normalized_role: Output of normalize_job_role
+
+    Returns:
+        Canonical job role key string
+    """
+    return JOB_ROLE_KEY_RE.sub('/', normalized_role).lower()
+
+
 def parse_resume(json_data: Dict[str, Any]) -> Dict[str, Any]:
     raw_job_role = json_data.get("job_role", "")
     normalized_job_role = normalize_job_role(raw_job_role)
     resume = {
         "job_role": normalized_job_role,
+        "job_role_key": job_role_key(normalized_job_role),
         "professional_summary": [],
         "technical_skills": [],
         "experiences": []
@@ -117,11 +153,6 @@ def parse_resume(json_data: Dict[str, Any]) -> Dict[str, Any]:
         becomes 'PROFESSIONAL EXPERIENCE' and 'CONFIDENTIAL'.
         """
         new_content = []
-        # sort headers by length desc to match long ones first (e.g. PROFESSIONAL SUMMARY before SUMMARY)
-        headers = ["PROFESSIONAL EXPERIENCE", "TECHNICAL SKILLS", "PROFESSIONAL SUMMARY", "SUMMARY"]
-        # Pattern captures: Group 1 = Header, Group 2 = The rest
-        # We use strict start ^ and case insensitive flag
-        pattern = re.compile(r"^(" + "|".join(map(re.escape, headers)) + r")\s*(.+)$", re.IGNORECASE)
 
         for item in content:
             if item.get("type") != "p":
@@ -129,7 +160,7 @@ def parse_resume(json_data: Dict[str, Any]) -> Dict[str, Any]:
                 continue
             
             text = item.get("text", "").strip()
-            match = pattern.match(text)
+            match = MERGED_HEADER_RE.match(text)
             
             if match:
                 header_part = match.group(1).strip()
@@ -161,17 +192,9 @@ def parse_resume(json_data: Dict[str, Any]) -> Dict[str, Any]:
     # --- Identify section indices ---
     section_idx = {"SUMMARY": None, "TECHNICAL SKILLS": None, "PROFESSIONAL EXPERIENCE": None}
     
-    # regex patterns for section headers
-    # We strip trailing colons before matching, so the patterns don't need to handle them
-    SECTION_PATTERNS = [
-        (re.compile(r"^(?:PROFESSIONAL\s+)?SUMMARY$", re.IGNORECASE), "SUMMARY"),
-        (re.compile(r"^TECHNICAL\s+SKILLS$", re.IGNORECASE), "TECHNICAL SKILLS"),
-        (re.compile(r"^PROFESSIONAL\s+EXPERIENCE$", re.IGNORECASE), "PROFESSIONAL EXPERIENCE")
-    ]
-
     for i, e in enumerate(structured_content):
         # Use text_norm (original case, stripped) for regex with IGNORECASE
-        curr_text = re.sub(r"\s*:\s*$", "", e["text_norm"])
+        curr_text = TRAILING_COLON_RE.sub("", e["text_norm"])
         
         if e["type"] == "p":
              for pattern, section_key in SECTION_PATTERNS:
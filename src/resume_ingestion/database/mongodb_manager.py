@@ -18,6 +18,28 @@ class MongoDBManager:
         self.db = self.client[config.mongodb_database]
         self.collection = self.db[config.mongodb_collection]
         self.batch_size = config.get('mongodb.batch_size', 50)
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Create the indexes the retrieval queries rely on (idempotent)."""
+        try:
+            # The resume-id retriever queries job_role with $in and projects
+            # only resume_id; the compound index lets Mongo answer it as a
+            # covered index scan (no document fetch). Its job_role prefix also
+            # serves plain job_role lookups.
+            self.collection.create_index(
+                [("job_role", 1), ("resume_id", 1)],
+                name="job_role_resume_id"
+            )
+            # Canonical slash-collapsed role key written at parse time; the
+            # retriever queries it with a single equality per role instead of
+            # a 4x expanded $in over spacing variants.
+            self.collection.create_index(
+                [("job_role_key", 1), ("resume_id", 1)],
+                name="job_role_key_resume_id"
+            )
+        except PyMongoError as e:
+            logger.warning(f"Could not ensure job_role index: {e}")
 
     def claim_document(self, doc_id) -> Optional[dict]:
         """
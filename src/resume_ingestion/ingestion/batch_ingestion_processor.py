@@ -1,5 +1,6 @@
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from bson import ObjectId
 from resume_ingestion.vector_store.qdrant_manager import QdrantManager
 from resume_ingestion.database.mongodb_manager import MongoDBManager
@@ -23,59 +24,91 @@ class BatchIngestionProcessor:
         Process a single MongoDB document and ingest into Qdrant.
         Uses resume_id field as the primary identifier.
         """
-        # Get resume_id
+        staged = self._stage_document(document)
+        if staged is None:
+            return False
+
+        resume_id_str, collection_points = staged
+        try:
+            self.qdrant_manager.upsert_to_qdrant(collection_points)
+        except Exception as e:
+            return self._handle_upsert_failure(resume_id_str, e)
+
+        return self._mark_ingested(resume_id_str)
+
+    def _stage_document(self, document: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Prepare a document and build its Qdrant points (the CPU/GPU-bound
+        stage: normalization, keyword extraction, embedding). Returns
+        (resume_id, collection_points), or None after marking the document
+        failed in MongoDB.
+        """
         resume_id = document.get("resume_id")
         if not resume_id:
             logger.error("Document missing resume_id field")
-            return False
-        
+            return None
+
+        # Convert resume_id to string for Qdrant
+        resume_id_str = str(resume_id) if not isinstance(resume_id, str) else resume_id
+
         try:
-            # Convert resume_id to string for Qdrant
-            resume_id_str = str(resume_id) if not isinstance(resume_id, str) else resume_id
-            
             # Ensure document has resume_id field
             document["resume_id"] = resume_id_str
-            
+
             # Prepare document for Qdrant processing
             processed_doc = self._prepare_document(document)
-            
+
             # Ensure resume_id is consistent
             processed_doc["resume_id"] = resume_id_str
-            
-            logger.debug(f"Processing document: resume_id={resume_id_str}")
-            
+
+            logger.debug("Processing document: resume_id=%s", resume_id_str)
+
             # Prepare points for Qdrant
             collection_points = self.qdrant_manager.prepare_points_for_resume(processed_doc)
-            
+
             if not collection_points:
                 logger.warning(f"No collection points generated for document {resume_id_str}")
                 self.mongo_manager.mark_as_failed(resume_id_str, "No embeddings generated")
-                return False
-            
+                return None
+
             # Validate that resume_id is consistent in all points
             total_points = sum(len(points) for points in collection_points.values())
             logger.info(f"Generated {total_points} points for resume_id={resume_id_str}")
-            
-            # Upsert to Qdrant
-            self.qdrant_manager.upsert_to_qdrant(collection_points)
-            
-            # Mark as successful in MongoDB using resume_id
-            success = self.mongo_manager.mark_as_ingested(resume_id_str)
-            if success:
-                logger.info(f"Successfully processed document resume_id={resume_id_str}")
-            else:
-                logger.warning(f"Document {resume_id_str} processed but couldn't update MongoDB status")
-            
-            return True
-            
+
+            return resume_id_str, collection_points
+
         except Exception as e:
-            logger.error(f"Error processing document {resume_id}: {e}", exc_info=True)
-            # Mark as failed using resume_id
+            logger.error(f"Error processing document {resume_id_str}: {e}", exc_info=True)
             try:
                 self.mongo_manager.mark_as_failed(resume_id_str, str(e))
             except Exception as e2:
                 logger.error(f"Failed to mark document as failed: {e2}")
-            return False
+            return None
+
+    def _mark_ingested(self, resume_id_str: str) -> bool:
+        """Mark a fully-upserted document as ingested in MongoDB."""
+        success = self.mongo_manager.mark_as_ingested(resume_id_str)
+        if success:
+            logger.info(f"Successfully processed document resume_id={resume_id_str}")
+        else:
+            logger.warning(f"Document {resume_id_str} processed but couldn't update MongoDB status")
+        return True
+
+    def _handle_upsert_failure(self, resume_id_str: str, error: Exception) -> bool:
+        logger.error(f"Error upserting document {resume_id_str}: {error}", exc_info=True)
+        try:
+            self.mongo_manager.mark_as_failed(resume_id_str, str(error))
+        except Exception as e2:
+            logger.error(f"Failed to mark document as failed: {e2}")
+        return False
+
+    def _complete_upsert(self, resume_id_str: str, future) -> bool:
+        """Wait for an in-flight upsert and record its MongoDB outcome."""
+        try:
+            future.result()
+        except Exception as e:
+            return self._handle_upsert_failure(resume_id_str, e)
+        return self._mark_ingested(resume_id_str)
     
     def process_batch(self) -> Dict[str, Any]:
         """
@@ -102,14 +135,47 @@ class BatchIngestionProcessor:
         
         successful = 0
         failed = 0
-        
-        # Process each document
-        for document in documents:
-            if self.process_single_document(document):
-                successful += 1
-            else:
-                failed += 1
-        
+
+        # Defer HNSW index building for the whole batch so inserts are flat
+        # appends; the index is rebuilt once in the finally block
+        self.qdrant_manager.suspend_indexing()
+        try:
+            # Two-stage pipeline: while the encode-heavy _stage_document runs
+            # on document N, the network-bound upsert of document N-1 is in
+            # flight on a single-worker pool. The one-worker pool doubles as a
+            # bounded queue - at most one staged document is buffered - so
+            # throughput approaches max(stage times) instead of their sum
+            # without memory growing with the batch.
+            with ThreadPoolExecutor(max_workers=1) as upsert_pool:
+                in_flight = None  # (resume_id, future) of the pending upsert
+                for document in documents:
+                    staged = self._stage_document(document)
+
+                    if in_flight is not None:
+                        if self._complete_upsert(*in_flight):
+                            successful += 1
+                        else:
+                            failed += 1
+                        in_flight = None
+
+                    if staged is None:
+                        failed += 1
+                        continue
+
+                    resume_id_str, collection_points = staged
+                    in_flight = (
+                        resume_id_str,
+                        upsert_pool.submit(self.qdrant_manager.upsert_to_qdrant, collection_points)
+                    )
+
+                if in_flight is not None:
+                    if self._complete_upsert(*in_flight):
+                        successful += 1
+                    else:
+                        failed += 1
+        finally:
+            self.qdrant_manager.restore_indexing()
+
         logger.info(f"Batch processing complete: {successful} successful, {failed} failed")
         return {
             "processed": len(documents),
@@ -136,7 +136,7 @@ def debug_processing_detailed():
         test_text = "This is a test sentence for embedding generation"
         try:
             vectors = qdrant.embedding_service.encode_texts([test_text])
-            if vectors and len(vectors) > 0:
+            if len(vectors) > 0:
                 logger.info(f" Manual embedding test PASSED: {len(vectors[0])} dimensions")
             else:
                 logger.error("Manual embedding test FAILED: No vectors returned")
@@ -83,7 +83,7 @@ def test_embedding_service():
         test_texts = ["This is a test sentence.", "Another test for embedding."]
         embeddings = embedding_service.encode_texts(test_texts)
         
-        if embeddings and len(embeddings) == len(test_texts):
+        if len(embeddings) == len(test_texts):
             logger.info(f" Embedding generation successful: {len(embeddings)} vectors created")
             logger.info(f" Vector dimension: {len(embeddings[0])}")
         else:
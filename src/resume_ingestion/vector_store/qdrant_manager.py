@@ -1,8 +1,16 @@
+import os
 import uuid
 import time
 import re
+import heapq
+import logging
+import hashlib
+import operator
+import functools
 import numpy as np
+from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qmodels
@@ -22,13 +30,65 @@ class QdrantError(Exception):
     pass
 
 
+def _uuid4_stream(block_size: int = 256):
+    """
+    Yield random UUID4 strings, drawing entropy from os.urandom in blocks.
+
+    Point-id generation calls uuid.uuid4() once per chunk, and each call is a
+    separate 16-byte read from the OS entropy pool; amortizing one read over
+    block_size ids makes per-point id cost a slice plus a format. version=4
+    sets the RFC 4122 version/variant bits, so the ids are indistinguishable
+    from uuid.uuid4() output.
+    """
+    while True:
+        raw = os.urandom(16 * block_size)
+        for i in range(0, len(raw), 16):
+            yield str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+
+
+# Staging runs single-threaded per resume, so a shared generator is safe
+_point_ids = _uuid4_stream()
+
+
+@functools.lru_cache(maxsize=256)
+def _embed_text_cached(embedding_service, text: str) -> bytes:
+    """
+    Memoized single-text embedding. The same job description flows through
+    several pipeline entry points per request, and each transformer forward
+    pass costs tens-to-hundreds of ms; caching on (service, text) makes the
+    repeats free. Returns FP16 bytes - immutable for the cache and half the
+    memory of an FP32 tuple.
+    """
+    vectors = embedding_service.encode_texts([text])
+    if len(vectors) == 0:
+        raise QdrantError("Failed to embed job description")
+    return np.asarray(vectors[0], dtype=np.float16).tobytes()
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_keywords_cached(text: str, min_score: float) -> Tuple[str, ...]:
+    """
+    Memoized keyword extraction. The same job description is keyword-extracted
+    by several entry points per request (matching, section scoring, keyword
+    pipelines); the NLP pass is CPU-heavy, so repeats come from cache.
+    """
+    return tuple(extract_keywords(text, min_score=min_score))
+
+
 class QdrantManager:
     """
     QdrantManager with keyword extraction and matching capabilities.
     """
 
-    def __init__(self):
-        self.embedding_service = create_embedding_service()
+    # Vectorless collection holding one point per resume with pre-joined,
+    # pre-truncated section text so query-time code never concatenates chunks
+    META_COLLECTION = "resume_meta"
+    COMPACT_TEXT_LIMIT = 2000
+
+    def __init__(self, embedding_service=None):
+        # Accept an already-loaded embedding service so callers that hold one
+        # (e.g. diagnostics) don't pay for a second model load
+        self.embedding_service = embedding_service or create_embedding_service()
         self.collections_mapping = getattr(config, "collections", {})
 
         if not self.collections_mapping:
@@ -41,22 +101,36 @@ class QdrantManager:
             }
 
         self.client = self._initialize_client()
+        # Collections whose payload indexes have already been verified (lazy, per process)
+        self._indexed: set = set()
         self._ensure_collections_exist()
 
     # ---------------------------------------------------------------------
     # Qdrant Initialization
     # ---------------------------------------------------------------------
     def _initialize_client(self, max_retries: int = 5) -> QdrantClient:
-        """Initialize Qdrant client with retry logic."""
+        """
+        Initialize Qdrant client with retry logic.
+
+        Uses gRPC transport (prefer_grpc=True) for all search/scroll traffic:
+        protobuf serialization and connection reuse cut per-call latency well
+        below the HTTP/JSON default on the many short scrolls this module makes.
+        Requires the Qdrant gRPC port (6334 by default) to be reachable in
+        addition to the REST port.
+        """
         timeout = self._get_config_timeout()
-        
-        logger.info(f"Connecting to Qdrant at {config.qdrant_host}:{config.qdrant_port}")
+        grpc_port = config.qdrant_grpc_port
+
+        logger.info(f"Connecting to Qdrant at {config.qdrant_host}:{config.qdrant_port} (gRPC port {grpc_port})")
 
         for attempt in range(max_retries):
             try:
                 client = QdrantClient(
                     host=config.qdrant_host,
                     port=config.qdrant_port,
+                    grpc_port=grpc_port,
+                    prefer_grpc=True,
+                    grpc_options=[("grpc.max_receive_message_length", 64 * 1024 * 1024)],
                     timeout=timeout
                 )
                 client.get_collections()  # Test connection
@@ -100,6 +174,27 @@ class QdrantManager:
                 logger.error(f"Error with collection '{collection_name}': {e}")
                 raise
 
+        self._ensure_meta_collection(existing_names)
+
+    def _ensure_meta_collection(self, existing_names: List[str]):
+        """Create the vectorless resume_meta collection if it doesn't exist."""
+        if self.META_COLLECTION in existing_names:
+            return
+        try:
+            self.client.create_collection(
+                collection_name=self.META_COLLECTION,
+                vectors_config={}  # payload-only collection, no vectors
+            )
+            self.client.create_payload_index(
+                collection_name=self.META_COLLECTION,
+                field_name="resume_id",
+                field_schema=qmodels.PayloadSchemaType.KEYWORD
+            )
+            logger.info(f"🆕 Created Qdrant collection: {self.META_COLLECTION}")
+        except Exception as e:
+            # Non-fatal: query paths fall back to joining chunk text
+            logger.warning(f"Could not create '{self.META_COLLECTION}' collection: {e}")
+
     def _create_collection_with_payload_schema(self, collection_name: str, max_retries: int = 5):
         """Create a collection with proper payload schema configuration."""
         vector_size = self.embedding_service.get_vector_size()
@@ -110,7 +205,19 @@ class QdrantManager:
                     collection_name=collection_name,
                     vectors_config=qmodels.VectorParams(
                         size=vector_size,
-                        distance=qmodels.Distance.COSINE
+                        distance=qmodels.Distance.COSINE,
+                        # FP16 storage halves the bytes scanned per query
+                        datatype=qmodels.Datatype.FLOAT16,
+                        # Originals are only touched during rescoring, so keep
+                        # them on disk and leave RAM to the quantized copies
+                        # and payload indexes
+                        on_disk=True
+                    ),
+                    # Binary quantization keeps a 1-bit-per-dim copy in RAM for
+                    # the first-pass scan; searches rescore candidates against
+                    # the full-precision vectors (see _search_collection)
+                    quantization_config=qmodels.BinaryQuantization(
+                        binary=qmodels.BinaryQuantizationConfig(always_ram=True)
                     ),
                 )
                 logger.info(f"🆕 Created Qdrant collection: {collection_name}")
@@ -165,6 +272,56 @@ class QdrantManager:
         except Exception as e:
             logger.warning(f"Could not configure payload schema for '{collection_name}': {e}")
 
+    def _ensure_payload_indexes(self, collection_name: str):
+        """
+        Verify (once per collection, memoized) that the fields every filter in
+        this module keys on are payload-indexed. Without these indexes Qdrant
+        degrades server-side filtering to a full payload scan, so missing ones
+        are created on the spot and reported loudly.
+        """
+        if collection_name in self._indexed:
+            return
+
+        required_fields = {
+            "resume_id": qmodels.PayloadSchemaType.KEYWORD,
+            "job_role": qmodels.PayloadSchemaType.KEYWORD,
+            "keywords": qmodels.PayloadSchemaType.KEYWORD,
+            # The redesign retriever filters every collection by domain
+            "domain": qmodels.PayloadSchemaType.KEYWORD,
+        }
+        if collection_name == "experiences":
+            # MatchText on experience_role needs a full-text index
+            required_fields["experience_role"] = qmodels.PayloadSchemaType.TEXT
+
+        try:
+            info = self.client.get_collection(collection_name=collection_name)
+            payload_schema = info.payload_schema or {}
+        except Exception as e:
+            logger.error(f"Could not verify payload indexes for '{collection_name}': {e}")
+            raise QdrantError(f"Failed to inspect payload schema for '{collection_name}': {e}")
+
+        for field_name, field_schema in required_fields.items():
+            if field_name in payload_schema:
+                continue
+            logger.info(
+                f"Payload index missing for '{field_name}' on '{collection_name}' "
+                f"- creating it (filters would otherwise full-scan)"
+            )
+            try:
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema
+                )
+            except Exception as e:
+                logger.error(f"Failed to create payload index '{field_name}' on '{collection_name}': {e}")
+                raise QdrantError(
+                    f"Collection '{collection_name}' is missing a payload index on "
+                    f"'{field_name}' and it could not be created: {e}"
+                )
+
+        self._indexed.add(collection_name)
+
     def _ensure_payload_indexing(self, collection_name: str):
         """Ensure payload indexes exist for existing collections."""
         try:
@@ -196,13 +353,13 @@ class QdrantManager:
         try:
             if not text or not text.strip():
                 return []
-                
-            keywords = extract_keywords(text, min_score=min_score)
-            logger.debug(f"Extracted {len(keywords)} keywords from text")
+
+            keywords = list(_extract_keywords_cached(text, min_score))
+            logger.debug("Extracted %d keywords from text", len(keywords))
             return keywords
             
         except Exception as e:
-            logger.warning(f"Keyword extraction failed: {e}")
+            logger.warning("Keyword extraction failed: %s", e)
             return []
 
     def _extract_keywords_from_list(self, items: List[str], min_score: float = 0.9) -> List[str]:
@@ -218,7 +375,7 @@ class QdrantManager:
             return self._extract_keywords_from_text(combined_text, min_score)
             
         except Exception as e:
-            logger.warning(f"Keyword extraction from list failed: {e}")
+            logger.warning("Keyword extraction from list failed: %s", e)
             return []
 
     # ---------------------------------------------------------------------
@@ -288,10 +445,10 @@ class QdrantManager:
                         break
                 
                 if section_data is None:
-                    logger.debug(f"No data found for section '{section_key}' in resume {resume_id}")
+                    logger.debug("No data found for section '%s' in resume %s", section_key, resume_id)
                     continue
 
-                logger.debug(f"Processing section '{section_key}' for collection '{collection_name}'")
+                logger.debug("Processing section '%s' for collection '%s'", section_key, collection_name)
 
                 if section_key == "experiences":
                     self._process_experiences_as_chunks(section_data, collection_points, collection_name, resume_id, domain, job_role)
@@ -302,11 +459,54 @@ class QdrantManager:
                     )
                     
             except Exception as e:
-                logger.error(f"Error processing section '{section_key}' for resume {resume_id}: {e}")
+                logger.error("Error processing section '%s' for resume %s: %s", section_key, resume_id, e)
                 continue
 
+        # Sections stage their chunks with vector=None; encode them all in
+        # one batched forward pass instead of one model call per chunk
+        self._encode_pending_points(collection_points, resume_id)
+
+        self._append_meta_point(collection_points, resume_id, domain, job_role)
+
         return collection_points
 
+    @staticmethod
+    def _meta_point_id(resume_id: str) -> str:
+        """Deterministic point id so each resume has exactly one meta point."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"resume-meta:{resume_id}"))
+
+    def _append_meta_point(
+        self,
+        collection_points: Dict[str, List[Dict]],
+        resume_id: str,
+        domain: str,
+        job_role: str
+    ):
+        """
+        Precompute the compact (joined + truncated) summary/skills text at
+        ingestion time and stage it as a single resume_meta point, so query
+        paths can fetch it with one retrieve instead of joining chunks.
+        """
+        def compact_text(collection_key: str) -> str:
+            collection_name = self.collections_mapping.get(collection_key)
+            points = collection_points.get(collection_name, []) if collection_name else []
+            joined = " ".join(p["payload"].get("text", "") for p in points)
+            return joined[:self.COMPACT_TEXT_LIMIT]
+
+        payload = {
+            "resume_id": resume_id,
+            "domain": domain,
+            "job_role": job_role,
+            "summary_text_compact": compact_text("professional_summary"),
+            "skills_text_compact": compact_text("technical_skills"),
+        }
+
+        collection_points[self.META_COLLECTION] = [{
+            "id": self._meta_point_id(resume_id),
+            "vector": {},
+            "payload": payload
+        }]
+
     def _process_experiences_as_chunks(
         self,
         experiences: List[Dict[str, Any]],
@@ -325,7 +525,7 @@ class QdrantManager:
                 responsibilities = exp.get("responsibilities", [])
 
                 if not responsibilities:
-                    logger.debug(f"No responsibilities found for {exp_job_role} ({resume_id})")
+                    logger.debug("No responsibilities found for %s (%s)", exp_job_role, resume_id)
                     continue
 
                 # Create cohesive experience text
@@ -358,10 +558,6 @@ class QdrantManager:
                 for chunk_idx, chunk in enumerate(text_chunks):
                     if not chunk.strip():
                         continue
-                        
-                    vector = self._encode_text_safely(chunk, resume_id, f"exp-{exp_idx}-{chunk_idx}")
-                    if not vector:
-                        continue
 
                     # Extract keywords for this specific chunk
                     chunk_keywords = self._extract_keywords_from_text(chunk)
@@ -387,17 +583,19 @@ class QdrantManager:
                     # Remove empty fields from payload
                     payload = {k: v for k, v in payload.items() if v not in [None, ""]}
 
-                    point_id = str(uuid.uuid4())
+                    # Vector filled in by _encode_pending_points in one
+                    # batched forward pass over the whole resume
+                    point_id = next(_point_ids)
                     collection_points[collection_name].append({
                         "id": point_id,
-                        "vector": vector,
+                        "vector": None,
                         "payload": payload
                     })
-                    
-                    logger.debug(f"Created experience chunk {chunk_idx+1}/{len(text_chunks)} for '{exp_job_role}' with {len(all_keywords)} keywords")
+
+                    logger.debug("Created experience chunk %d/%d for '%s' with %d keywords", chunk_idx + 1, len(text_chunks), exp_job_role, len(all_keywords))
                     
             except Exception as e:
-                logger.error(f"Error parsing experience {exp_idx} in resume {resume_id}: {e}")
+                logger.error("Error parsing experience %d in resume %s: %s", exp_idx, resume_id, e)
                 continue
 
     def _process_standard_section(
@@ -416,7 +614,7 @@ class QdrantManager:
                 # Join list items with spaces for embedding
                 text_items = [str(item).strip() for item in data if item and str(item).strip()]
                 if not text_items:
-                    logger.debug(f"Empty text items for section '{section_key}' in resume {resume_id}")
+                    logger.debug("Empty text items for section '%s' in resume %s", section_key, resume_id)
                     return
                 full_text = " ".join(text_items)
                 
@@ -428,7 +626,7 @@ class QdrantManager:
                 section_keywords = self._extract_keywords_from_text(full_text)
                 
             if not full_text:
-                logger.debug(f"Empty text for section '{section_key}' in resume {resume_id}")
+                logger.debug("Empty text for section '%s' in resume %s", section_key, resume_id)
                 return
 
             # Split text into chunks if needed (let the embedding service decide)
@@ -437,10 +635,6 @@ class QdrantManager:
             for chunk_idx, chunk in enumerate(text_chunks):
                 if not chunk.strip():
                     continue
-                    
-                vector = self._encode_text_safely(chunk, resume_id, f"{section_key}-{chunk_idx}")
-                if not vector:
-                    continue
 
                 # Extract keywords for this specific chunk
                 chunk_keywords = self._extract_keywords_from_text(chunk)
@@ -459,85 +653,208 @@ class QdrantManager:
                     "keywords": all_keywords  # Add extracted keywords
                 }
                 
-                point_id = str(uuid.uuid4())
+                # Vector filled in by _encode_pending_points in one batched
+                # forward pass over the whole resume
+                point_id = next(_point_ids)
                 collection_points[collection_name].append({
                     "id": point_id,
-                    "vector": vector,
+                    "vector": None,
                     "payload": payload
                 })
-                
-                logger.debug(f"Created {section_key} chunk {chunk_idx+1}/{len(text_chunks)} with {len(all_keywords)} keywords")
+
+                logger.debug("Created %s chunk %d/%d with %d keywords", section_key, chunk_idx + 1, len(text_chunks), len(all_keywords))
                 
         except Exception as e:
-            logger.error(f"Error processing section '{section_key}' for resume {resume_id}: {e}")
+            logger.error("Error processing section '%s' for resume %s: %s", section_key, resume_id, e)
 
     # ---------------------------------------------------------------------
     # Embedding & Validation
     # ---------------------------------------------------------------------
 
-    def _encode_text_safely(self, text: str, resume_id: str, section: str) -> Optional[List[float]]:
-        """Safely encode text to vector with error handling."""
+    # Persistent JD embedding cache; survives process restarts, unlike lru_cache.
+    # Vectors are stored as FP16 bytes to halve the on-disk footprint.
+    _jd_cache_dir = Path(os.getenv("JD_EMBED_CACHE_DIR", "/tmp/jd_emb_cache"))
+
+    def _jd_cache_path(self, text: str) -> Path:
+        """Content-hash cache path for a JD embedding, keyed by model + text."""
+        model_name = getattr(self.embedding_service, "model_name", "default")
+        digest = hashlib.sha256(f"{model_name}:{text}".encode()).hexdigest()
+        return self._jd_cache_dir / f"{digest}.f16"
+
+    def _embed_jd(self, job_description: str) -> np.ndarray:
+        """
+        Embed a job description, reusing memoized/disk-cached vectors for
+        repeat JDs. Returns an FP16 array - the qdrant client serializes
+        numpy arrays directly, so search traffic ships half the bytes and the
+        FP16 collections (see _create_collection_with_payload_schema) lose
+        nothing.
+        """
+        cache_path = self._jd_cache_path(job_description)
+
         try:
-            if not text or not text.strip():
-                logger.warning(f"Empty text for {resume_id}:{section}")
-                return None
-                
-            vectors = self.embedding_service.encode_texts([text])
-            
-            if not vectors or len(vectors) == 0:
-                logger.error(f"No vectors returned for {resume_id}:{section}")
-                return None
-                
-            vector = vectors[0]
-            
-            # Validate vector dimensions
-            expected_size = self.embedding_service.get_vector_size()
-            if len(vector) != expected_size:
-                logger.error(
-                    f"Vector dimension mismatch for {resume_id}:{section} - "
-                    f"expected {expected_size}, got {len(vector)}"
-                )
-                return None
-                
-            return vector
-            
+            if cache_path.exists():
+                vector = np.frombuffer(cache_path.read_bytes(), dtype=np.float16)
+                if len(vector) == self.embedding_service.get_vector_size():
+                    return vector
+                logger.warning(f"Stale JD embedding cache entry {cache_path.name}; re-encoding")
+        except OSError as e:
+            logger.debug(f"JD embedding cache read failed: {e}")
+
+        vector = np.frombuffer(_embed_text_cached(self.embedding_service, job_description), dtype=np.float16)
+
+        try:
+            self._jd_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(vector.tobytes())
+        except OSError as e:
+            logger.debug(f"JD embedding cache write failed: {e}")
+
+        return vector
+
+    def _encode_pending_points(self, collection_points: Dict[str, List[Dict]], resume_id: str):
+        """
+        Fill in vectors for every staged point in one batched forward pass.
+
+        Section processing stages points with vector=None; encoding all chunk
+        texts together lets the model batch internally instead of running a
+        forward pass per chunk. Points whose vector fails validation are
+        dropped, mirroring the old per-chunk skip behavior.
+        """
+        pending = [
+            point
+            for collection_name, points in collection_points.items()
+            if collection_name != self.META_COLLECTION
+            for point in points
+            if point["vector"] is None
+        ]
+        if not pending:
+            return
+
+        texts = [point["payload"]["text"] for point in pending]
+        try:
+            vectors = self.embedding_service.encode_texts(texts)
         except Exception as e:
-            logger.error(f"Embedding failed for {resume_id}:{section}: {e}")
-            return None
+            logger.error(f"Batch embedding failed for resume {resume_id}: {e}")
+            vectors = []
+
+        expected_size = self.embedding_service.get_vector_size()
+        if len(vectors) == len(pending):
+            for point, vector in zip(pending, vectors):
+                if len(vector) == expected_size:
+                    point["vector"] = vector
+                else:
+                    logger.error(
+                        f"Vector dimension mismatch for resume {resume_id} - "
+                        f"expected {expected_size}, got {len(vector)}"
+                    )
+        else:
+            logger.error(
+                f"Expected {len(pending)} vectors for resume {resume_id}, got {len(vectors)}"
+            )
+
+        # Drop any point that did not receive a valid vector
+        for collection_name, points in collection_points.items():
+            if collection_name == self.META_COLLECTION:
+                continue
+            collection_points[collection_name] = [p for p in points if p["vector"] is not None]
 
     # ---------------------------------------------------------------------
     # Upsert Logic
     # ---------------------------------------------------------------------
 
+    # Optimizer indexing threshold restored after a bulk ingest window
+    DEFAULT_INDEXING_THRESHOLD = 20000
+
+    def suspend_indexing(self):
+        """
+        Disable HNSW index building (indexing_threshold=0) on all mapped
+        collections for the duration of a bulk ingest. With indexing enabled,
+        every inserted point pays a graph-insert cost that grows with
+        collection size; with it deferred, ingest is a flat append and the
+        index is built once when restore_indexing() re-raises the threshold.
+        Failures are non-fatal - upserts still work, just slower.
+        """
+        self._set_indexing_threshold(0)
+
+    def restore_indexing(self, indexing_threshold: int = DEFAULT_INDEXING_THRESHOLD):
+        """Re-enable HNSW indexing after a bulk ingest window."""
+        self._set_indexing_threshold(indexing_threshold)
+
+    def _set_indexing_threshold(self, indexing_threshold: int):
+        for collection_name in self.collections_mapping.values():
+            try:
+                self.client.update_collection(
+                    collection_name=collection_name,
+                    optimizer_config=qmodels.OptimizersConfigDiff(
+                        indexing_threshold=indexing_threshold
+                    )
+                )
+                logger.debug(
+                    f"Set indexing_threshold={indexing_threshold} on '{collection_name}'"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Could not set indexing_threshold on '{collection_name}': {e}"
+                )
+
+    # Concurrent in-flight upsert batches; the gRPC client is thread-safe and
+    # releases the GIL during RPC, so batches overlap instead of serializing
+    # one network round-trip after another
+    UPSERT_MAX_WORKERS = 8
+
     def upsert_to_qdrant(self, collection_points: Dict[str, List[Dict]], max_retries: int = 5):
         """Upsert points with proper error handling and batch processing."""
         if not collection_points:
             logger.warning("No points to upsert")
             return
 
-        total_upserted = 0
-        total_upserted = 0
-        batch_size = config.get("processing.batch_size", 100)
+        batch_size = config.get("processing.batch_size", 512)
 
+        batches = []
         for collection_name, points in collection_points.items():
             if not points:
-                logger.debug(f"No points for collection '{collection_name}'")
+                logger.debug("No points for collection '%s'", collection_name)
                 continue
 
             logger.info(f"Upserting {len(points)} points to '{collection_name}'")
-
-            # Process in batches
             for i in range(0, len(points), batch_size):
-                batch = points[i:i + batch_size]
-                batch_upserted = self._upsert_batch_with_retry(collection_name, batch, max_retries)
-                total_upserted += batch_upserted
+                batches.append((collection_name, points[i:i + batch_size]))
+
+        if not batches:
+            logger.info(" Upsert completed: 0 total points across all collections")
+            return
+
+        total_upserted = 0
+        failures = []
+        with ThreadPoolExecutor(max_workers=min(self.UPSERT_MAX_WORKERS, len(batches))) as executor:
+            futures = [
+                executor.submit(self._upsert_batch_with_retry, collection_name, batch, max_retries)
+                for collection_name, batch in batches
+            ]
+            for future in as_completed(futures):
+                try:
+                    total_upserted += future.result()
+                except QdrantError as e:
+                    failures.append(str(e))
+
+        if failures:
+            # Surface permanent batch failures instead of silently leaving
+            # gaps in the index; callers mark the document failed in MongoDB,
+            # which is this pipeline's replay queue
+            raise QdrantError(
+                f"{len(failures)} upsert batch(es) failed permanently "
+                f"({total_upserted} points upserted before failure): {failures[0]}"
+            )
 
         logger.info(f" Upsert completed: {total_upserted} total points across all collections")
 
     def _upsert_batch_with_retry(self, collection_name: str, batch: List[Dict], max_retries: int) -> int:
-        """Upsert a single batch with retry logic."""
-        point_structs = self._create_point_structs(batch, collection_name)
-        if not point_structs:
+        """
+        Upsert a single batch with bounded exponential-backoff retry.
+        Raises QdrantError once retries are exhausted so the caller can
+        record the document as failed rather than reporting partial success.
+        """
+        points, n_points = self._create_point_batch(batch, collection_name)
+        if not n_points:
             return 0
 
         for attempt in range(max_retries):
@@ -545,55 +862,85 @@ class QdrantManager:
                 # Use upsert with wait=True for durability
                 result = self.client.upsert(
                     collection_name=collection_name,
-                    points=point_structs,
+                    points=points,
                     wait=True
                 )
-                
+
                 if result.status == 'completed':
-                    logger.debug(f" Batch of {len(point_structs)} points upserted to '{collection_name}'")
-                    return len(point_structs)
+                    logger.debug(" Batch of %d points upserted to '%s'", n_points, collection_name)
+                    return n_points
                 else:
                     logger.warning(f"Upsert status not completed: {result.status}")
-                    
+
             except Exception as e:
                 logger.warning(f"Upsert attempt {attempt + 1}/{max_retries} failed for '{collection_name}': {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to upsert batch to '{collection_name}' after {max_retries} attempts")
-                    return 0
+                    raise QdrantError(
+                        f"Upsert batch of {n_points} points to '{collection_name}' "
+                        f"failed after {max_retries} attempts: {e}"
+                    )
                 time.sleep(2 ** attempt)
-                
-        return 0
 
-    def _create_point_structs(
+        raise QdrantError(
+            f"Upsert batch of {n_points} points to '{collection_name}' "
+            f"never reached completed status after {max_retries} attempts"
+        )
+
+    def _create_point_batch(
         self, points: List[Dict], collection_name: str
-    ) -> List[qmodels.PointStruct]:
-        """Create PointStruct objects with proper Qdrant schema."""
-        point_structs = []
-        
-        for p in points:
-            try:
-                # Validate required fields
-                if not all(k in p for k in ['id', 'vector', 'payload']):
-                    logger.warning(f"Missing required fields in point for '{collection_name}'")
-                    continue
-                    
-                if not isinstance(p['vector'], list) or len(p['vector']) != self.embedding_service.get_vector_size():
-                    logger.warning(f"Invalid vector in point {p['id']} for '{collection_name}'")
+    ) -> Tuple[Any, int]:
+        """
+        Build the upsert payload for a batch of staged points.
+
+        Vector collections use the columnar qmodels.Batch - ids, vectors and
+        payloads as three parallel lists - so the client validates bulk
+        fields once instead of constructing one PointStruct model per point.
+        The payload-only meta collection keeps PointStructs, since it ships
+        no vectors. Numpy vector rows are converted to plain lists at this
+        boundary only, because the client's request models validate floats
+        strictly.
+
+        Returns (points_for_upsert, point_count); count is 0 when nothing
+        in the batch validated.
+        """
+        if collection_name == self.META_COLLECTION:
+            structs = []
+            for p in points:
+                try:
+                    if not all(k in p for k in ('id', 'vector', 'payload')):
+                        logger.warning("Missing required fields in point for '%s'", collection_name)
+                        continue
+                    structs.append(qmodels.PointStruct(
+                        id=p["id"],
+                        vector=p["vector"],
+                        payload=p["payload"]
+                    ))
+                except Exception as e:
+                    logger.error("Failed to create PointStruct for point in '%s': %s", collection_name, e)
                     continue
+            return structs, len(structs)
 
-                # Create PointStruct with proper typing
-                point_struct = qmodels.PointStruct(
-                    id=p["id"],
-                    vector=p["vector"],
-                    payload=p["payload"]
-                )
-                point_structs.append(point_struct)
-                
-            except Exception as e:
-                logger.error(f"Failed to create PointStruct for point in '{collection_name}': {e}")
+        expected_size = self.embedding_service.get_vector_size()
+        ids, vectors, payloads = [], [], []
+        for p in points:
+            # Validate required fields
+            if not all(k in p for k in ('id', 'vector', 'payload')):
+                logger.warning("Missing required fields in point for '%s'", collection_name)
                 continue
-                
-        return point_structs
+
+            vector = p['vector']
+            if vector is None or len(vector) != expected_size:
+                logger.warning("Invalid vector in point %s for '%s'", p['id'], collection_name)
+                continue
+
+            ids.append(p['id'])
+            vectors.append(vector.tolist() if hasattr(vector, 'tolist') else list(vector))
+            payloads.append(p['payload'])
+
+        if not ids:
+            return None, 0
+        return qmodels.Batch(ids=ids, vectors=vectors, payloads=payloads), len(ids)
 
     # ---------------------------------------------------------------------
     # Simple Keyword Matching
@@ -626,32 +973,33 @@ class QdrantManager:
         
         # Get all resume payloads
         resume_payloads = self.fetch_all_payloads_for_resume_ids(resume_ids)
-        
-        match_results = {}
-        
-        for resume_id in resume_ids:
-            # Extract all keywords from this resume
-            resume_keywords = set()
-            
-            # Get keywords from all sections of this resume
+
+        # Vectorize the intersection: only JD keywords can ever match, so the
+        # vocabulary is just the JD keyword set. Build a (resumes x keywords)
+        # presence matrix and count matches per row in one NumPy pass instead
+        # of a Python set intersection per resume.
+        vocab = {kw: i for i, kw in enumerate(sorted(jd_keywords))}
+        presence = np.zeros((len(resume_ids), len(vocab)), dtype=np.uint8)
+
+        for row, resume_id in enumerate(resume_ids):
             resume_data = resume_payloads.get(resume_id, {})
             for section_name, payloads in resume_data.items():
                 for payload in payloads:
-                    keywords = payload.get("keywords", [])
-                    resume_keywords.update(keywords)
-            
-            # Calculate match percentage
-            if not jd_keywords:
-                match_percentage = 0.0
-            else:
-                matched_keywords = jd_keywords.intersection(resume_keywords)
-                match_percentage = len(matched_keywords) / len(jd_keywords)
-            
+                    for keyword in payload.get("keywords", []):
+                        col = vocab.get(keyword)
+                        if col is not None:
+                            presence[row, col] = 1
+
+        match_counts = presence.sum(axis=1)
+
+        match_results = {}
+        for row, resume_id in enumerate(resume_ids):
+            match_percentage = float(match_counts[row]) / len(jd_keywords)
             match_results[resume_id] = match_percentage
-            
-            logger.info(f"Resume {resume_id}: {match_percentage:.1%} match "
-                       f"({len(matched_keywords)}/{len(jd_keywords)} keywords)")
-        
+
+            logger.info("Resume %s: %.1f%% match (%d/%d keywords)",
+                        resume_id, match_percentage * 100, int(match_counts[row]), len(jd_keywords))
+
         return match_results
 
 
@@ -735,17 +1083,40 @@ class QdrantManager:
     # Resume matching & retrieval
     # ----------------------------
 
-    def _search_collection(self, collection_name: str, vector: List[float], top_k: int = 50, resume_ids_filter: Optional[List[str]] = None) -> List[Dict]:
+    def _resolve_sections(self, section_keys: List[str], log_prefix: str) -> List[Tuple[str, str]]:
+        """
+        Resolve section keys to (section_key, collection_name) pairs up front,
+        logging any missing sections once instead of re-checking the mapping
+        inside hot loops.
+        """
+        resolved = []
+        for section_key in section_keys:
+            collection_name = self.collections_mapping.get(section_key)
+            if collection_name:
+                resolved.append((section_key, collection_name))
+            else:
+                logger.warning(
+                    f"{log_prefix} Section '{section_key}' not in collections_mapping; skipping."
+                )
+        return resolved
+
+    def _search_collection(self, collection_name: str, vector: List[float], top_k: int = 50, resume_ids_filter: Optional[List[str]] = None, payload_fields: Optional[List[str]] = None) -> List[Dict]:
         """
         Search a collection and return list of results with resume_id and score.
-        
+
         Args:
             collection_name: Name of the collection to search
             vector: Query vector for semantic search
             top_k: Number of top results to return
             resume_ids_filter: Optional list of resume_ids to filter results by
+            payload_fields: Optional payload projection; callers that only need
+                resume_id + score should pass ["resume_id"] to avoid shipping
+                full chunk payloads over the wire. None returns everything.
         """
         try:
+            if resume_ids_filter:
+                self._ensure_payload_indexes(collection_name)
+
             # Build filter if resume_ids_filter is provided
             search_filter = None
             if resume_ids_filter:
@@ -760,14 +1131,27 @@ class QdrantManager:
             
             # Search without score threshold to get all matching results
             # Qdrant by default may filter low-scoring results, so we explicitly set score_threshold=None
+            with_payload = (
+                qmodels.PayloadSelectorInclude(include=payload_fields)
+                if payload_fields else True
+            )
             results = self.client.search(
                 collection_name=collection_name,
                 query_vector=vector,
                 limit=top_k,
-                with_payload=True,
+                with_payload=with_payload,
                 with_vectors=False,
                 query_filter=search_filter,
-                score_threshold=None  # No threshold - get all results even with low scores
+                score_threshold=None,  # No threshold - get all results even with low scores
+                # Rescore the quantized candidate pool with full-precision
+                # vectors so binary quantization costs no accuracy
+                search_params=qmodels.SearchParams(
+                    quantization=qmodels.QuantizationSearchParams(
+                        ignore=False,
+                        rescore=True,
+                        oversampling=2.0
+                    )
+                )
             )
         except Exception as e:
             logger.error(f"Search failed on {collection_name}: {e}")
@@ -822,10 +1206,7 @@ class QdrantManager:
                 weights = {k: v / total_weight for k, v in weights.items()}
 
         # embed job description
-        jd_vecs = self.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
-            raise QdrantError("Failed to embed job description")
-        jd_vector = jd_vecs[0]
+        jd_vector = self._embed_jd(job_description)
 
         # map of collection_key -> actual collection name in QdrantManager config
         collection_name_map = self.collections_mapping
@@ -899,9 +1280,14 @@ class QdrantManager:
         # Extract all resume IDs that were found
         all_resume_ids = list(aggregated.keys())
         
-        # Calculate keyword match scores
-        logger.info(f"Calculating keyword matches for {len(all_resume_ids)} resumes...")
-        keyword_match_scores = self.calculate_keyword_match_percentage(job_description, all_resume_ids)
+        # Calculate keyword match scores (skipped entirely in semantic-only mode
+        # since keyword scoring is the scroll-heavy path)
+        if keyword_weight > 0.0:
+            logger.info(f"Calculating keyword matches for {len(all_resume_ids)} resumes...")
+            keyword_match_scores = self.calculate_keyword_match_percentage(job_description, all_resume_ids)
+        else:
+            logger.info("keyword_weight is 0.0 - skipping keyword match calculation")
+            keyword_match_scores = {}
         
         # Combine semantic and keyword scores
         for rid in all_resume_ids:
@@ -915,10 +1301,10 @@ class QdrantManager:
             aggregated[rid]["keyword_score"] = float(keyword_score)
             aggregated[rid]["score"] = float(hybrid_score)
             
-            logger.debug(f"Resume {rid}: semantic={semantic_score:.3f}, keyword={keyword_score:.3f}, hybrid={hybrid_score:.3f}")
+            logger.debug("Resume %s: semantic=%.3f, keyword=%.3f, hybrid=%.3f", rid, semantic_score, keyword_score, hybrid_score)
 
         # sort by hybrid score descending
-        sorted_resumes = sorted([(rid, v["score"]) for rid, v in aggregated.items()], key=lambda x: x[1], reverse=True)
+        sorted_resumes = sorted([(rid, v["score"]) for rid, v in aggregated.items()], key=operator.itemgetter(1), reverse=True)
 
         # return top-k (or all if less)
         top_resumes = sorted_resumes[:aggregate_top_k]
@@ -968,21 +1354,23 @@ class QdrantManager:
                                  f"This may indicate a mismatch between MongoDB and Qdrant.")
         
         # Embed job description
-        jd_vecs = self.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
-            raise QdrantError("Failed to embed job description")
-        jd_vector = jd_vecs[0]
+        jd_vector = self._embed_jd(job_description)
         
         # Semantic search on this collection only
         # Request more results to ensure we get top_k unique resume IDs
-        # (some resumes may have many chunks, so we need a higher multiplier)
-        search_limit = max(top_k * 20, 50)  # At least 20x top_k or 50, whichever is higher
+        # (some resumes may have many chunks, so we need a higher multiplier).
+        # When a resume_ids_filter is given, size the request up-front to cover
+        # the whole filtered set so no second "extended" search is needed.
+        search_limit = max(top_k * 20, 50)
+        if resume_ids_filter:
+            search_limit = max(search_limit, min(len(resume_ids_filter) * 5, 200))
         logger.info(f"Section '{section_key}': Requesting {search_limit} search results (top_k={top_k})")
         search_results = self._search_collection(
             collection_name,
             jd_vector,
             top_k=search_limit,
-            resume_ids_filter=resume_ids_filter
+            resume_ids_filter=resume_ids_filter,
+            payload_fields=["resume_id"]
         )
         
         if not search_results:
@@ -1006,82 +1394,91 @@ class QdrantManager:
         
         resume_ids = list(resume_semantic_scores.keys())
         logger.info(f"Section '{section_key}': Extracted {len(resume_ids)} unique resume IDs from {len(search_results)} search results")
-        
-        # If we don't have enough unique resume IDs, try requesting even more results
+
         if len(resume_ids) < top_k and resume_ids_filter:
-            logger.warning(f"Section '{section_key}': Only found {len(resume_ids)} unique resume IDs, need {top_k}. "
-                         f"Trying to request more results...")
-            # Try requesting even more results (up to the filter size)
-            extended_limit = min(len(resume_ids_filter) * 5, 200)  # Request up to 5x filter size or 200
-            if extended_limit > search_limit:
-                logger.info(f"Section '{section_key}': Requesting {extended_limit} search results (extended)")
-                extended_results = self._search_collection(
-                    collection_name,
-                    jd_vector,
-                    top_k=extended_limit,
-                    resume_ids_filter=resume_ids_filter
-                )
-                # Merge results
-                for result in extended_results:
-                    rid = result.get("resume_id")
-                    score = result.get("score", 0.0)
-                    if rid:
-                        if rid not in resume_semantic_scores or score > resume_semantic_scores[rid]:
-                            resume_semantic_scores[rid] = score
-                resume_ids = list(resume_semantic_scores.keys())
-                logger.info(f"Section '{section_key}': After extended search, extracted {len(resume_ids)} unique resume IDs")
-        
+            # search_limit already covered the filtered set, so a second
+            # "extended" search would just repeat the same request
+            logger.warning(f"Section '{section_key}': Only found {len(resume_ids)} unique resume IDs, need {top_k}")
+
+        # Semantic-only mode: keyword scoring is the scroll-heavy path, so skip it
+        if keyword_weight <= 0.0:
+            logger.info(f"Section '{section_key}': keyword_weight is 0.0 - returning semantic-only results")
+            sorted_results = sorted(
+                resume_semantic_scores.items(),
+                key=operator.itemgetter(1),
+                reverse=True
+            )
+            return sorted_results[:top_k]
+
         # Extract keywords from job description
         jd_keywords = set(self._extract_keywords_from_text(job_description))
-        
+
         if not jd_keywords:
             logger.warning("No keywords extracted from job description")
             # Return semantic-only results
             sorted_results = sorted(
                 resume_semantic_scores.items(),
-                key=lambda x: x[1],
+                key=operator.itemgetter(1),
                 reverse=True
             )
             return sorted_results[:top_k]
         
         logger.info(f"Extracted {len(jd_keywords)} keywords for section '{section_key}'")
         
-        # Calculate keyword matches for this section only
-        resume_keyword_scores = {}
-        for rid in resume_ids:
-            # Fetch payloads for this resume and section
-            resume_keywords = set()
-            
-            flt = qmodels.Filter(
-                must=[qmodels.FieldCondition(key="resume_id", match=qmodels.MatchValue(value=rid))]
-            )
-            
-            try:
-                points, _ = self.client.scroll(
+        # Calculate keyword matches for this section only.
+        # One batched scroll over all candidate resume_ids (paginated via
+        # next_page_offset) instead of one scroll RPC per resume. The `should`
+        # clause pushes keyword filtering into Qdrant's indexed core: only
+        # chunks carrying at least one JD keyword come back, which is exactly
+        # the set that can contribute to the intersection counts.
+        resume_keywords_by_rid: Dict[str, set] = defaultdict(set)
+
+        self._ensure_payload_indexes(collection_name)
+        flt = qmodels.Filter(
+            must=[qmodels.FieldCondition(key="resume_id", match=qmodels.MatchAny(any=resume_ids))],
+            should=[qmodels.FieldCondition(key="keywords", match=qmodels.MatchAny(any=list(jd_keywords)))]
+        )
+
+        try:
+            next_offset = None
+            while True:
+                points, next_offset = self.client.scroll(
                     collection_name=collection_name,
-                    with_payload=True,
+                    with_payload=qmodels.PayloadSelectorInclude(include=["resume_id", "keywords"]),
                     with_vectors=False,
                     scroll_filter=flt,
-                    limit=1000
+                    limit=1024,
+                    offset=next_offset
                 )
-                
+
                 for point in points:
                     payload = point.payload or {}
-                    keywords = payload.get("keywords", [])
-                    resume_keywords.update(keywords)
-                
-                # Calculate match percentage
-                if jd_keywords:
-                    matched_keywords = jd_keywords.intersection(resume_keywords)
-                    match_percentage = len(matched_keywords) / len(jd_keywords)
-                else:
-                    match_percentage = 0.0
-                
-                resume_keyword_scores[rid] = match_percentage
-                
-            except Exception as e:
-                logger.warning(f"Failed to fetch keywords for resume {rid} in section '{section_key}': {e}")
-                resume_keyword_scores[rid] = 0.0
+                    rid = payload.get("resume_id")
+                    if rid:
+                        resume_keywords_by_rid[rid].update(payload.get("keywords", []))
+
+                if next_offset is None:
+                    break
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch keywords for section '{section_key}': {e}")
+
+        # Same vectorization as calculate_keyword_match_percentage: a
+        # (resumes x JD keywords) presence matrix summed per row replaces the
+        # per-resume Python set intersection.
+        vocab = {kw: i for i, kw in enumerate(sorted(jd_keywords))}
+        presence = np.zeros((len(resume_ids), len(vocab)), dtype=np.uint8)
+        for row, rid in enumerate(resume_ids):
+            for keyword in resume_keywords_by_rid.get(rid, ()):
+                col = vocab.get(keyword)
+                if col is not None:
+                    presence[row, col] = 1
+
+        match_counts = presence.sum(axis=1)
+        resume_keyword_scores = {
+            rid: float(match_counts[row]) / len(jd_keywords)
+            for row, rid in enumerate(resume_ids)
+        }
         
         # Combine semantic and keyword scores
         hybrid_scores = {}
@@ -1092,12 +1489,12 @@ class QdrantManager:
             hybrid_score = (semantic_weight * semantic_score) + (keyword_weight * keyword_score)
             hybrid_scores[rid] = hybrid_score
             
-            logger.debug(f"Section '{section_key}' - Resume {rid}: semantic={semantic_score:.3f}, keyword={keyword_score:.3f}, hybrid={hybrid_score:.3f}")
+            logger.debug("Section '%s' - Resume %s: semantic=%.3f, keyword=%.3f, hybrid=%.3f", section_key, rid, semantic_score, keyword_score, hybrid_score)
         
         # Sort by hybrid score and return top_k
         sorted_results = sorted(
             hybrid_scores.items(),
-            key=lambda x: x[1],
+            key=operator.itemgetter(1),
             reverse=True
         )
         
@@ -1108,31 +1505,79 @@ class QdrantManager:
         """
         Fetch all payload entries for given resume_ids across all collections.
         Returns dict: resume_id -> { collection_key: [payloads...] }
+
+        Issues one MatchAny scroll per collection (paginated through
+        next_page_offset) instead of a scroll per (resume, collection) pair,
+        and projects payloads down to the fields downstream consumers read
+        (resume_id, text, keywords).
         """
         out = {rid: {k: [] for k in self.collections_mapping.keys()} for rid in resume_ids}
+        if not resume_ids:
+            return out
 
-        for rid in resume_ids:
-            flt = qmodels.Filter(
-                must=[qmodels.FieldCondition(key="resume_id", match=qmodels.MatchValue(value=rid))]
-            )
-            for key, collection_name in self.collections_mapping.items():
-                try:
-                    points, _ = self.client.scroll(
+        flt = qmodels.Filter(
+            must=[qmodels.FieldCondition(key="resume_id", match=qmodels.MatchAny(any=list(resume_ids)))]
+        )
+
+        for key, collection_name in self.collections_mapping.items():
+            try:
+                self._ensure_payload_indexes(collection_name)
+            except QdrantError:
+                pass  # scrolls still work unindexed, just slower
+
+            try:
+                next_offset = None
+                while True:
+                    points, next_offset = self.client.scroll(
                         collection_name=collection_name,
-                        with_payload=True,
+                        with_payload=qmodels.PayloadSelectorInclude(include=["resume_id", "text", "keywords"]),
                         with_vectors=False,
                         scroll_filter=flt,
-                        limit=1000
+                        limit=1024,
+                        offset=next_offset
                     )
                     for p in points:
                         payload = p.payload or {}
-                        out[rid][key].append(payload)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch payloads for resume_id {rid} from {collection_name}: {e}")
-                    continue
+                        rid = payload.get("resume_id")
+                        if rid in out:
+                            out[rid][key].append(payload)
+                    if next_offset is None:
+                        break
+            except Exception as e:
+                logger.warning(f"Failed to fetch payloads from {collection_name}: {e}")
+                continue
 
         return out
 
+    def fetch_compact_texts(self, resume_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Fetch precomputed compact summary/skills text from the resume_meta
+        collection in one retrieve RPC. Returns resume_id -> compact payload;
+        resumes ingested before resume_meta existed are simply absent and
+        callers should fall back to joining chunk text.
+        """
+        if not resume_ids:
+            return {}
+
+        try:
+            records = self.client.retrieve(
+                collection_name=self.META_COLLECTION,
+                ids=[self._meta_point_id(rid) for rid in resume_ids],
+                with_payload=True,
+                with_vectors=False
+            )
+        except Exception as e:
+            logger.warning(f"Failed to retrieve compact texts from '{self.META_COLLECTION}': {e}")
+            return {}
+
+        out = {}
+        for record in records:
+            payload = record.payload or {}
+            rid = payload.get("resume_id")
+            if rid:
+                out[rid] = payload
+        return out
+
     def get_resume_ids_by_job_roles(self, job_roles: List[str]) -> List[str]:
         """
         Get all unique resume_ids that match any of the given job roles.
@@ -1220,43 +1665,37 @@ class QdrantManager:
         section: str
     ):
         """Fetch ALL chunks for given resume_ids directly from Qdrant"""
-        output_blocks = []  
+        section_to_key = {
+            "summary": "professional_summary",
+            "skills": "technical_skills",
+            "experience": "experiences",
+        }
+        if section not in section_to_key:
+            raise ValueError(f"Unknown section: {section}")
+        key = section_to_key[section]
+
+        output_blocks = []
         logger.info(f"Starting fetch for resume_ids: {resume_ids}, section: {section}")
 
+        # Fetch payloads for all resumes in one pass instead of one call per rid
+        data = self.fetch_all_payloads_for_resume_ids(resume_ids)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Raw data fetched: {data}")
+
         for rid in resume_ids:
-            logger.info(f"Processing resume_id: {rid}")
-            
-            # Fetch full payloads for this resume
-            data = self.fetch_all_payloads_for_resume_ids([rid])
-            logger.info(f"Raw data fetched: {data}")
-            
             if rid not in data:
                 logger.warning(f"Resume ID {rid} not found in fetched data")
                 output_blocks.append("")
                 continue
-                
-            resume_data = data[rid]
-            logger.info(f"Resume data keys: {list(resume_data.keys())}")
-
-            # Choose section chunks
-            if section == "summary":
-                chunks = resume_data.get("professional_summary", [])
-            elif section == "skills":
-                chunks = resume_data.get("technical_skills", [])
-            elif section == "experience":
-                chunks = resume_data.get("experiences", [])
-            else:
-                raise ValueError(f"Unknown section: {section}")
-                
-            logger.info(f"Found {len(chunks)} chunks for section '{section}'")
 
-            # Join all chunk text
-            full_text = " ".join([c.get("text", "") for c in chunks])
-            logger.info(f"Concatenated text length: {len(full_text)}")
-            
+            chunks = data[rid].get(key, ())
+            logger.debug(f"Found {len(chunks)} chunks for section '{section}' (resume {rid})")
+
+            # Join all chunk text (generator avoids an intermediate list)
+            full_text = " ".join(c.get("text", "") for c in chunks)
             output_blocks.append(full_text)
 
-        logger.info(f"Final output blocks: {output_blocks}")
+        logger.info(f"Fetched {len(output_blocks)} text blocks for section '{section}'")
         return output_blocks
 
 
@@ -1294,6 +1733,8 @@ class QdrantManager:
             return {rid: 0.0 for rid in resume_ids}
         logger.info(f"Keywords from JD: {jd_keywords}")
 
+        self._ensure_payload_indexes(collection_name)
+
         resume_keyword_scores: Dict[str, float] = {}
 
         for rid in resume_ids:
@@ -1308,7 +1749,7 @@ class QdrantManager:
             try:
                 points, _ = self.client.scroll(
                     collection_name=collection_name,
-                    with_payload=True,
+                    with_payload=qmodels.PayloadSelectorInclude(include=["keywords"]),
                     with_vectors=False,
                     scroll_filter=flt,
                     limit=max_points_per_resume,
@@ -1409,38 +1850,38 @@ class QdrantManager:
                 "for this pipeline to work."
             )
 
-        # ---- Step 2: Keyword scores on summaries ----
+        # ---- Steps 2+3: Keyword scores on summaries and experiences ----
+        # The two collections are independent Qdrant queries and the client
+        # releases the GIL on I/O, so score them concurrently.
         logger.info(
-            "[Keyword→Semantic] Computing keyword scores for professional_summary collection"
-        )
-        summary_keyword_scores = self._compute_keyword_scores_for_collection(
-            collection_name=summary_collection,
-            jd_keywords=jd_keywords,
-            resume_ids=resume_ids_filter,
-        )
-
-        # ---- Step 3: Keyword scores on experiences ----
-        logger.info(
-            "[Keyword→Semantic] Computing keyword scores for experiences collection"
-        )
-        experiences_keyword_scores = self._compute_keyword_scores_for_collection(
-            collection_name=experiences_collection,
-            jd_keywords=jd_keywords,
-            resume_ids=resume_ids_filter,
+            "[Keyword→Semantic] Computing keyword scores for professional_summary "
+            "and experiences collections"
         )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            summary_future = executor.submit(
+                self._compute_keyword_scores_for_collection,
+                collection_name=summary_collection,
+                jd_keywords=jd_keywords,
+                resume_ids=resume_ids_filter,
+            )
+            experiences_future = executor.submit(
+                self._compute_keyword_scores_for_collection,
+                collection_name=experiences_collection,
+                jd_keywords=jd_keywords,
+                resume_ids=resume_ids_filter,
+            )
+            summary_keyword_scores = summary_future.result()
+            experiences_keyword_scores = experiences_future.result()
 
         # ---- Step 4: Merge & sort candidates by keyword score ----
         # We combine scores from summary + experiences; if a resume appears in both,
         # we take the max keyword score among the two (you could also use average/sum).
         combined_keyword_scores: Dict[str, float] = defaultdict(float)
 
-        for rid, score in summary_keyword_scores.items():
-            if score > combined_keyword_scores[rid]:
-                combined_keyword_scores[rid] = score
-
-        for rid, score in experiences_keyword_scores.items():
-            if score > combined_keyword_scores[rid]:
-                combined_keyword_scores[rid] = score
+        for section_scores in (summary_keyword_scores, experiences_keyword_scores):
+            for rid, score in section_scores.items():
+                if score > combined_keyword_scores[rid]:
+                    combined_keyword_scores[rid] = score
 
         if not combined_keyword_scores:
             logger.warning(
@@ -1453,30 +1894,24 @@ class QdrantManager:
                 top_k=top_k,
             )
 
-        # Sort by keyword score, descending
-        sorted_by_keyword = sorted(
+        # Keep only the top candidates by keyword score before the semantic
+        # phase; heapq.nlargest is O(N log k) vs O(N log N) for a full sort
+        # and caps semantic-search cost.
+        candidate_cutoff = max(top_k * 10, 50)
+        sorted_by_keyword = heapq.nlargest(
+            candidate_cutoff,
             combined_keyword_scores.items(),
-            key=lambda x: x[1],
-            reverse=True,
+            key=operator.itemgetter(1),
         )
 
-        # Unique union of IDs is just keys in combined_keyword_scores; we also keep ordering.
         candidate_resume_ids = [rid for rid, _ in sorted_by_keyword]
         logger.info(
             f"[Keyword→Semantic] Candidate set after keyword phase: "
-            f"{len(candidate_resume_ids)} resumes"
+            f"{len(candidate_resume_ids)} resumes (cutoff={candidate_cutoff})"
         )
 
-        # Optional: You can cap candidate size before semantic to control cost.
-        # For example, keep only top N by keyword:
-        # candidate_cutoff = max(top_k * 10, 50)
-        # candidate_resume_ids = candidate_resume_ids[:candidate_cutoff]
-
-        # ---- Step 5: Embed job description once ----
-        jd_vecs = self.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
-            raise QdrantError("[Keyword→Semantic] Failed to embed job description")
-        jd_vector = jd_vecs[0]
+        # ---- Step 5: Embed job description once (cached across entry points) ----
+        jd_vector = self._embed_jd(job_description)
 
         # ---- Step 6: Semantic search across 3 sections, restricted to candidate IDs ----
         # We'll aggregate semantic scores per resume across:
@@ -1484,47 +1919,59 @@ class QdrantManager:
         #   - professional_summary
         #   - experiences
         sections_for_semantic = ["technical_skills", "professional_summary", "experiences"]
+        sections_resolved = self._resolve_sections(sections_for_semantic, "[Keyword→Semantic]")
 
         semantic_scores: Dict[str, float] = defaultdict(float)
 
-        for section_key in sections_for_semantic:
-            collection_name = self.collections_mapping.get(section_key)
-            if not collection_name:
-                logger.warning(
-                    f"[Keyword→Semantic] Section '{section_key}' not in collections_mapping; "
-                    f"skipping."
+        # Decide how many results to request per collection: scale with the
+        # candidate set rather than a flat 20x multiplier, so small filters
+        # don't drag hundreds of results per section. Max-aggregation per
+        # resume means modest headroom suffices.
+        search_limit = min(max(top_k * 5, len(candidate_resume_ids)), 500)
+
+        # The three section searches are independent and I/O-bound, so issue
+        # them concurrently instead of paying three serial round trips.
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max(len(sections_resolved), 1)) as executor:
+            for section_key, collection_name in sections_resolved:
+                logger.info(
+                    f"[Keyword→Semantic] Semantic search on section '{section_key}' "
+                    f"(collection={collection_name}) with limit={search_limit}"
                 )
-                continue
-
-            # Decide how many results to request per collection
-            search_limit = max(top_k * 20, len(candidate_resume_ids) * 5, 50)
-            logger.info(
-                f"[Keyword→Semantic] Semantic search on section '{section_key}' "
-                f"(collection={collection_name}) with limit={search_limit}"
-            )
-
-            section_results = self._search_collection(
-            collection_name=collection_name,
-            vector=jd_vector,
-            top_k=search_limit,
-            resume_ids_filter=candidate_resume_ids,
-        )
-
-            if not section_results:
-                logger.warning(
-                    f"[Keyword→Semantic] No semantic results for section '{section_key}'"
+                future = executor.submit(
+                    self._search_collection,
+                    collection_name=collection_name,
+                    vector=jd_vector,
+                    top_k=search_limit,
+                    resume_ids_filter=candidate_resume_ids,
+                    payload_fields=["resume_id"],
                 )
-                continue
+                futures[future] = section_key
 
-            for result in section_results:
-                rid = result.get("resume_id")
-                score = result.get("score", 0.0)
-                if not rid:
+            for future in as_completed(futures):
+                section_key = futures[future]
+                section_results = future.result()
+
+                if not section_results:
+                    logger.warning(
+                        f"[Keyword→Semantic] No semantic results for section '{section_key}'"
+                    )
                     continue
 
+                # Pre-reduce to one max per resume within the section, then
+                # merge - far fewer defaultdict hits than updating the shared
+                # dict per raw result (resumes have many chunks per section)
+                section_max: Dict[str, float] = {}
+                for result in section_results:
+                    rid = result.get("resume_id")
+                    score = result.get("score", 0.0)
+                    if rid and score > section_max.get(rid, -1.0):
+                        section_max[rid] = score
+
                 # We keep the max semantic score per resume across *all* sections
-                if score > semantic_scores[rid]:
-                    semantic_scores[rid] = score
+                for rid, score in section_max.items():
+                    if score > semantic_scores[rid]:
+                        semantic_scores[rid] = score
 
         if not semantic_scores:
             logger.warning(
@@ -1534,18 +1981,18 @@ class QdrantManager:
             return []
 
         # ---- Step 7: Final ranking by semantic score only ----
-        final_sorted = sorted(
+        top_resumes = heapq.nlargest(
+            top_k,
             semantic_scores.items(),
-            key=lambda x: x[1],
-            reverse=True,
+            key=operator.itemgetter(1),
         )
 
         logger.info(
             f"[Keyword→Semantic] Returning top {top_k} resumes from "
-            f"{len(final_sorted)} semantic candidates"
+            f"{len(semantic_scores)} semantic candidates"
         )
 
-        return final_sorted[:top_k]
+        return top_resumes
 
     def _semantic_only_on_filtered_resumes(
         self,
@@ -1560,51 +2007,51 @@ class QdrantManager:
         if not resume_ids_filter:
             return []
 
-        jd_vecs = self.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
-            raise QdrantError("[Semantic-only] Failed to embed job description")
-        jd_vector = jd_vecs[0]
+        jd_vector = self._embed_jd(job_description)
 
         sections_for_semantic = ["technical_skills", "professional_summary", "experiences"]
+        sections_resolved = self._resolve_sections(sections_for_semantic, "[Semantic-only]")
         semantic_scores: Dict[str, float] = defaultdict(float)
 
-        for section_key in sections_for_semantic:
-            collection_name = self.collections_mapping.get(section_key)
-            if not collection_name:
-                logger.warning(
-                    f"[Semantic-only] Section '{section_key}' not in collections_mapping; "
-                    f"skipping."
-                )
-                continue
-
-            search_limit = max(top_k * 20, len(resume_ids_filter) * 5, 50)
+        # Bounded the same way as the keyword→semantic pipeline
+        search_limit = min(max(top_k * 5, len(resume_ids_filter)), 500)
 
-            section_results = self._search_collection(
-                collection_name=collection_name,
-                query_vector=jd_vector,
-                top_k=search_limit,
-                resume_ids_filter=resume_ids_filter,
-            )
+        # Same concurrent fan-out as the keyword→semantic pipeline
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max(len(sections_resolved), 1)) as executor:
+            for section_key, collection_name in sections_resolved:
+                future = executor.submit(
+                    self._search_collection,
+                    collection_name=collection_name,
+                    vector=jd_vector,
+                    top_k=search_limit,
+                    resume_ids_filter=resume_ids_filter,
+                    payload_fields=["resume_id"],
+                )
+                futures[future] = section_key
 
-            if not section_results:
-                continue
+            for future in as_completed(futures):
+                section_results = future.result()
 
-            for result in section_results:
-                rid = result.get("resume_id")
-                score = result.get("score", 0.0)
-                if not rid:
+                if not section_results:
                     continue
 
-                if score > semantic_scores[rid]:
-                    semantic_scores[rid] = score
+                section_max: Dict[str, float] = {}
+                for result in section_results:
+                    rid = result.get("resume_id")
+                    score = result.get("score", 0.0)
+                    if rid and score > section_max.get(rid, -1.0):
+                        section_max[rid] = score
+
+                for rid, score in section_max.items():
+                    if score > semantic_scores[rid]:
+                        semantic_scores[rid] = score
 
         if not semantic_scores:
             return []
 
-        final_sorted = sorted(
+        return heapq.nlargest(
+            top_k,
             semantic_scores.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-
-        return final_sorted[:top_k]
\ No newline at end of file
+            key=operator.itemgetter(1),
+        )
\ No newline at end of file
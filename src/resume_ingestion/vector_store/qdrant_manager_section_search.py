@@ -28,7 +28,7 @@
         
         # Embed job description
         jd_vecs = self.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
+        if len(jd_vecs) == 0:
             raise QdrantError("Failed to embed job description")
         jd_vector = jd_vecs[0]
         
@@ -1,34 +1,41 @@
-from typing import List
+import re
+from typing import Iterator, List
 from pymongo.errors import PyMongoError
 from src.utils.logger import get_logger
 from src.core.db_manager import get_mongodb_manager, get_qdrant_manager
-from src.data_acquisition.parser import normalize_job_role
+from src.data_acquisition.parser import normalize_job_role, job_role_key
 import json
 
 
 logger = get_logger("DataRetrieverPipeline")
 
+# Split "a/b", "a / b", "a/ b", "a /b" into parts in one pass
+_SLASH_SPLIT = re.compile(r"\s*/\s*")
+
 class ResumeIdsRetriever:
     def __init__(self, mongo_manager, qdrant_manager):
         # Use singleton instances
         self.mongo_manager = mongo_manager
         self.qdrant_manager = qdrant_manager
     
-    def get_resume_ids_by_job_roles(self, job_roles: List[str]) -> List[str]:
+    def iter_resume_ids_by_job_roles(self, job_roles: List[str]) -> Iterator[str]:
         """
-        Retrieve document IDs for given job roles from MongoDB.
+        Lazily yield document IDs for given job roles from MongoDB.
         Uses consistent normalization to match how data is stored.
-        
+
+        Streaming consumers get IDs as the driver receives them - no up-front
+        list allocation; batch_size(1000) keeps the wire frames large.
+
         Args:
             job_roles: List of job roles to filter by
-            
-        Returns:
-            List of document IDs as strings (for use with Qdrant)
+
+        Yields:
+            Document IDs as strings (for use with Qdrant)
         """
         if not job_roles:
             logger.warning("Empty job_roles list provided")
-            return []
-        
+            return
+
         # Normalize job roles using the same function used during ingestion
         normalized_job_roles = []
         for role in job_roles:
@@ -36,57 +43,86 @@ class ResumeIdsRetriever:
                 normalized = normalize_job_role(role.strip())
                 if normalized:
                     normalized_job_roles.append(normalized)
-        
+
         if not normalized_job_roles:
             logger.warning("No valid job roles after normalization")
-            return []
-        
-        # Generate variations for roles with slashes to handle inconsistent DB data
-        expanded_roles = set(normalized_job_roles)
-        for role in normalized_job_roles:
-            if "/" in role:
-                # We want to generate all 4 combinations of spacing around slash:
-                # "a/b", "a / b", "a/ b", "a /b"
-                
-                # First, standardize to " / " to make splitting easy
-                # (normalize_job_role already reduces multiple spaces to one)
-                temp = role.replace("/", " / ").replace("  ", " ")
-                parts = temp.split(" / ")
-                
-                if len(parts) > 1:
-                    # Reconstruct with different separators
-                    # Note: This simple approach assumes one slash. 
-                    # For multiple slashes, it might be combinatorial, but let's stick to simple replacement for now.
-                    
-                    # 1. No spaces: "a/b"
-                    expanded_roles.add("/".join(parts))
-                    # 2. Both spaces: "a / b"
-                    expanded_roles.add(" / ".join(parts))
-                    # 3. Left space: "a /b"
-                    expanded_roles.add(" /".join(parts))
-                    # 4. Right space: "a/ b"
-                    expanded_roles.add("/ ".join(parts))
-
-        search_roles = list(expanded_roles)
-        logger.info(f"Searching MongoDB for job roles (normalized): {search_roles[:5]}...")
+            return
+
+        # Canonical slash-collapsed keys written at parse time: one key per
+        # role instead of 4 slash-spacing variants in the $in list.
+        search_keys = sorted({job_role_key(role) for role in normalized_job_roles})
+        logger.info(f"Searching MongoDB for job role keys: {search_keys[:5]}...")
+
+        # Project only resume_id with _id excluded, so the compound
+        # (job_role_key, resume_id) index created by MongoDBManager satisfies
+        # the query as a covered index scan - no document fetch, no
+        # intermediate list of full documents.
+        cursor = self.mongo_manager.collection.find(
+            {"job_role_key": {"$in": search_keys}},
+            {"resume_id": 1, "_id": 0}
+        ).hint("job_role_key_resume_id").batch_size(1000)
+
+        # resume_id is written as str(uuid4()) at ingestion, so the cursor
+        # already yields usable strings - no per-row str() allocation
+        for doc in cursor:
+            resume_id = doc.get("resume_id")
+            if resume_id:
+                yield resume_id
 
+        # Resumes ingested before job_role_key existed only carry the
+        # display-form job_role. Always union in the legacy variant query:
+        # gating it on an empty key-query result would silently drop
+        # pre-migration resumes whenever the corpus is mixed. The variant
+        # query excludes documents that have job_role_key, so the two result
+        # sets are disjoint and no dedup set is needed.
+        yield from self._get_resume_ids_by_job_role_variants(normalized_job_roles)
+
+    def get_resume_ids_by_job_roles(self, job_roles: List[str]) -> List[str]:
+        """
+        Materialized form of iter_resume_ids_by_job_roles for callers that
+        need a container.
+
+        Args:
+            job_roles: List of job roles to filter by
+
+        Returns:
+            List of document IDs as strings (for use with Qdrant)
+        """
         try:
-            # Query MongoDB - job_role field should be normalized during ingestion
-            documents = list(self.mongo_manager.collection.find(
-                {"job_role": {"$in": search_roles}},
-                {"resume_id": 1}  # Return only resume_id
-            ))
-            
-            # Extract resume_id as strings
-            document_ids = [str(doc.get("resume_id", "")) for doc in documents if doc.get("resume_id")]
-            
+            document_ids = list(self.iter_resume_ids_by_job_roles(job_roles))
             logger.info(f"Retrieved {len(document_ids)} document IDs from MongoDB for job roles: {job_roles}")
             return document_ids
-            
         except PyMongoError as e:
             logger.error(f"Error retrieving document IDs for job roles {job_roles}: {e}", exc_info=True)
             return []
 
+    def _get_resume_ids_by_job_role_variants(self, normalized_job_roles: List[str]) -> List[str]:
+        """
+        Legacy lookup against the display-form job_role field, expanding each
+        slashed role into its 4 spacing variants ("a/b", "a / b", "a /b",
+        "a/ b"). Restricted to documents without job_role_key (i.e. ingested
+        before the key existed): re-ingested documents carry both fields and
+        are already served by the key query, so excluding them keeps the
+        union duplicate-free. The $exists filter costs the covered-scan
+        property, but only pre-migration documents pay the fetch.
+        """
+        expanded_roles = set(normalized_job_roles)
+        for role in normalized_job_roles:
+            if "/" in role:
+                parts = _SLASH_SPLIT.split(role)
+                if len(parts) > 1:
+                    for separator in ("/", " / ", " /", "/ "):
+                        expanded_roles.add(separator.join(parts))
+
+        search_roles = sorted(expanded_roles)  # deterministic query shape
+
+        cursor = self.mongo_manager.collection.find(
+            {"job_role": {"$in": search_roles}, "job_role_key": {"$exists": False}},
+            {"resume_id": 1, "_id": 0}
+        ).hint("job_role_resume_id").batch_size(500)
+
+        return [doc["resume_id"] for doc in cursor if doc.get("resume_id")]
+
     def generate_candidate_pool_and_contents(self, job_description: str, top_k_resume=10):
         
         top_list, details = self.qdrant_manager.match_resumes_for_job_description(
@@ -100,17 +136,32 @@ class ResumeIdsRetriever:
         top_ids = [rid for rid, _ in top_list]
         contents = self.qdrant_manager.fetch_all_payloads_for_resume_ids(top_ids)
 
-        # Optionally, prepare compact structures for downstream LLM prompt
+        # Compact summary/skills text is precomputed at ingestion and stored in
+        # the resume_meta collection; one retrieve replaces the per-resume
+        # join+truncate string work. Resumes ingested before resume_meta
+        # existed fall back to joining chunk text.
+        meta = self.qdrant_manager.fetch_compact_texts(top_ids)
+
         compact = {}
         for rid in top_ids:
-            comp = {
+            c = contents[rid]
+            rid_meta = meta.get(rid)
+            if rid_meta is not None:
+                summary_text = rid_meta.get("summary_text_compact", "")
+                skills_text = rid_meta.get("skills_text_compact", "")
+            else:
+                # Generator feeds join directly - no temp list per field, and
+                # chunks without text are skipped instead of joined as ""
+                summary_text = " ".join(p["text"] for p in c.get("professional_summary", ()) if "text" in p)[:2000]
+                skills_text = " ".join(p["text"] for p in c.get("technical_skills", ()) if "text" in p)[:2000]
+
+            compact[rid] = {
                 "resume_id": rid,
-                "summary_text": " ".join([p.get("text", "") for p in contents[rid].get("professional_summary", [])])[:2000],
-                "skills_text": " ".join([p.get("text", "") for p in contents[rid].get("technical_skills", [])])[:2000],
-                "experience_texts": [p.get("text", "") for p in contents[rid].get("experiences", [])],
+                "summary_text": summary_text,
+                "skills_text": skills_text,
+                "experience_texts": [p["text"] for p in c.get("experiences", ()) if "text" in p],
                 "signals": details.get(rid, {})
             }
-            compact[rid] = comp
 
         return top_list, compact
 
@@ -1,19 +1,126 @@
 import re
-from typing import Dict, List, Any, Optional
+import hashlib
+import functools
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
 from src.resume_ingestion.vector_store.qdrant_manager import QdrantManager
 from qdrant_client.http import models as qmodels
 import logging
 
 logger = logging.getLogger("ResumeRetriever")
 
+# JD-analysis patterns, compiled once at import so hot-path retrieval only
+# runs the matcher instead of re-parsing pattern strings per call
+_SKILLS_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"(?:skills? in|proficient in|experienced with|knowledge of)\s+([^.,]+)",
+        r"(?:required|required skills?|qualifications?):\s*([^.,]+)",
+    )
+]
+_QUAL_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\b(\d+\+? years? experience)\b",
+        r"\b(Bachelor|Master|PhD)\b",
+        r"\b(degree|certification)\b",
+    )
+]
+
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+_DOMAIN_KEYWORDS = {
+    "software engineering": ["software", "developer", "engineer", "programming", "coding"],
+    "data science": ["data science", "machine learning", "ai", "analytics", "data analysis"],
+    "devops": ["devops", "cloud", "aws", "azure", "kubernetes", "docker", "infrastructure"],
+    "frontend": ["frontend", "react", "angular", "vue", "javascript", "ui", "ux"],
+    "backend": ["backend", "api", "server", "database", "microservices"],
+    "fullstack": ["fullstack", "full stack", "end-to-end"]
+}
+_KW_TO_DOMAIN = {kw: domain for domain, kws in _DOMAIN_KEYWORDS.items() for kw in kws}
+
+_SENIORITY_KEYWORDS = {
+    "senior": ["senior", "lead", "principal", "architect", "experienced"],
+    "mid": ["mid-level", "mid level", "intermediate"],
+    "junior": ["junior", "entry-level", "entry level", "graduate", "associate"]
+}
+_KW_TO_SENIORITY = {kw: level for level, kws in _SENIORITY_KEYWORDS.items() for kw in kws}
+
+_TECH_TERMS = (
+    "Python", "Java", "JavaScript", "React", "AWS", "Docker", "Kubernetes",
+    "SQL", "NoSQL", "Machine Learning", "AI", "TensorFlow", "PyTorch"
+)
+_TECH_LC = {t.lower(): t for t in _TECH_TERMS}
+
+# One alternation over the union of tech, domain and seniority keywords, so a
+# single DFA sweep of the JD feeds all three inferences instead of three
+# separate scans; longer keywords come first so multi-word phrases win over
+# their prefixes, and each hit is dispatched to every category it belongs to
+_JD_KEYWORD_RE = re.compile(
+    r"\b("
+    + "|".join(
+        sorted(
+            map(re.escape, set(_KW_TO_DOMAIN) | set(_KW_TO_SENIORITY) | set(_TECH_LC)),
+            key=len, reverse=True
+        )
+    )
+    + r")\b",
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _domain_filter(domain: Optional[str]) -> Optional[qmodels.Filter]:
+    """Domain filter objects are immutable per domain - build each once."""
+    if not domain:
+        return None
+    return qmodels.Filter(
+        must=[
+            qmodels.FieldCondition(
+                key="domain",
+                match=qmodels.MatchValue(value=domain)
+            )
+        ]
+    )
+
 class ResumeRetriever:
     """
     Advanced retrieval system for resume redesign with hybrid search capabilities
     """
-    def __init__(self, qdrant_manager: QdrantManager):
+    # Completed JD analyses keyed by text digest; bounded below
+    _JD_ANALYSIS_CACHE_SIZE = 256
+
+    def __init__(self, qdrant_manager: QdrantManager, hnsw_ef: int = 64):
         self.qdrant = qdrant_manager
         self.collections_mapping = qdrant_manager.collections_mapping
-        
+        self._jd_analysis_cache: Dict[bytes, Dict[str, Any]] = {}
+        # Capped ef terminates HNSW traversal earlier: a small recall trade
+        # for a direct cut in nodes visited per search. Tunable per deployment.
+        self._search_params = qmodels.SearchParams(hnsw_ef=hnsw_ef, exact=False)
+
+    # ---------------------------------------------------------------------
+    # Batched Qdrant helpers
+    # ---------------------------------------------------------------------
+
+    def _search_batch(self, collection_name: str, requests: List[qmodels.SearchRequest]) -> List[List]:
+        """
+        Submit several SearchRequests against one collection in a single RPC
+        (search_batch), instead of one round trip per term. Returns one result
+        list per request; failures yield empty lists so callers degrade softly.
+        """
+        if not requests:
+            return []
+        try:
+            return self.qdrant.client.search_batch(
+                collection_name=collection_name,
+                requests=requests
+            )
+        except Exception as e:
+            logger.error(f"Batch search failed on {collection_name}: {e}")
+            return [[] for _ in requests]
+
     def retrieve_for_redesign(self, job_description: str, user_resume: Dict = None, top_k: int = 5) -> Dict[str, Any]:
         """
         Main retrieval method that implements all strategies
@@ -24,17 +131,20 @@ class ResumeRetriever:
         jd_analysis = self._analyze_job_description(job_description)
         logger.info(f"JD Analysis - Domain: {jd_analysis.get('domain')}, Key Skills: {len(jd_analysis.get('key_skills', []))}")
         
-        # Stage 2: Multi-collection hybrid retrieval
-        collection_results = {}
-        
-        # Professional Summaries - Semantic focus
-        collection_results["professional_summaries"] = self._retrieve_summaries_hybrid(jd_analysis, top_k)
-        
-        # Technical Skills - Keyword + Semantic
-        collection_results["technical_skills"] = self._retrieve_skills_hybrid(jd_analysis, top_k)
-        
-        # Experiences - Domain-aware semantic
-        collection_results["experiences"] = self._retrieve_experiences_hybrid(jd_analysis, top_k)
+        # Stage 2: Multi-collection hybrid retrieval. The three retrievals are
+        # independent and dominated by Qdrant round trips (the client releases
+        # the GIL during RPC), so run them concurrently instead of stacking
+        # their latencies.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                # Professional Summaries - Semantic focus
+                "professional_summaries": executor.submit(self._retrieve_summaries_hybrid, jd_analysis, top_k),
+                # Technical Skills - Keyword + Semantic
+                "technical_skills": executor.submit(self._retrieve_skills_hybrid, jd_analysis, top_k),
+                # Experiences - Domain-aware semantic
+                "experiences": executor.submit(self._retrieve_experiences_hybrid, jd_analysis, top_k),
+            }
+            collection_results = {name: future.result() for name, future in futures.items()}
         
         # Stage 3: Cross-collection ranking and deduplication
         final_results = self._rank_and_deduplicate_results(collection_results, jd_analysis)
@@ -52,102 +162,127 @@ class ResumeRetriever:
     
     def _analyze_job_description(self, job_description: str) -> Dict[str, Any]:
         """Extract key components from job description for targeted retrieval"""
-        
-        # Generate embedding for semantic search
-        jd_vector = self.qdrant.embedding_service.encode_texts([job_description])[0]
-        
-        # Extract key information
-        key_terms = self._extract_key_terms(job_description)
-        domain = self._infer_domain(job_description, key_terms)
-        seniority = self._infer_seniority(job_description)
-        
-        return {
+
+        # Repeated retrievals for the same JD (pagination, re-ranking runs)
+        # skip the embedding forward pass and regex extraction entirely
+        digest = hashlib.blake2b(job_description.encode(), digest_size=16).digest()
+        cached = self._jd_analysis_cache.get(digest)
+        if cached is not None:
+            return cached
+
+        # Extract key information; tech, domain and seniority hits come from
+        # one fused keyword sweep over the text
+        technologies, domain_scores, seniority_levels = self._scan_jd_keywords(job_description)
+        key_terms = self._extract_key_terms(job_description, technologies)
+        domain = self._infer_domain(domain_scores, key_terms)
+        seniority = self._infer_seniority(seniority_levels)
+
+        # Embed the JD plus every skill/technology term the retrievers will
+        # search with in a single forward pass, instead of re-encoding terms
+        # one by one inside each hybrid retriever
+        skills = key_terms.get("skills", [])[:5]
+        technologies = key_terms.get("technologies", [])[:5]
+        all_vectors = self.qdrant.embedding_service.encode_texts(
+            [job_description] + skills + technologies
+        )
+        jd_vector = all_vectors[0]
+        skill_vectors = all_vectors[1:1 + len(skills)]
+        tech_vectors = all_vectors[1 + len(skills):]
+
+        jd_analysis = {
             "vector": jd_vector,
             "domain": domain,
             "key_skills": key_terms.get("skills", []),
             "key_technologies": key_terms.get("technologies", []),
             "key_qualifications": key_terms.get("qualifications", []),
+            # Lowercased once here so the ranking inner loops don't re-lower
+            # every term for every result
+            "key_skills_lc": [s.lower() for s in key_terms.get("skills", [])],
+            "key_technologies_lc": [t.lower() for t in key_terms.get("technologies", [])],
+            "skill_vectors": skill_vectors,
+            "tech_vectors": tech_vectors,
             "seniority_level": seniority,
             "raw_text": job_description
         }
-    
-    def _extract_key_terms(self, text: str) -> Dict[str, List[str]]:
+
+        if len(self._jd_analysis_cache) >= self._JD_ANALYSIS_CACHE_SIZE:
+            # Drop the oldest entry (insertion-ordered dict) to stay bounded
+            self._jd_analysis_cache.pop(next(iter(self._jd_analysis_cache)))
+        self._jd_analysis_cache[digest] = jd_analysis
+        return jd_analysis
+
+
+    def _scan_jd_keywords(self, text: str) -> Tuple[set, Dict[str, int], set]:
+        """
+        One fused keyword sweep over the JD text.
+
+        A single alternation regex covers technology, domain and seniority
+        keywords; each hit is dispatched to every category it belongs to, so
+        the text is traversed once instead of once per inference.
+        """
+        technologies = set()
+        domain_scores: Dict[str, int] = {}
+        seniority_levels = set()
+        seen_domain_keywords = set()
+
+        for match in _JD_KEYWORD_RE.finditer(text):
+            keyword = match.group(1).lower()
+
+            tech = _TECH_LC.get(keyword)
+            if tech is not None:
+                technologies.add(tech)
+
+            # Count each domain keyword once per JD to keep original scoring
+            domain = _KW_TO_DOMAIN.get(keyword)
+            if domain is not None and keyword not in seen_domain_keywords:
+                seen_domain_keywords.add(keyword)
+                domain_scores[domain] = domain_scores.get(domain, 0) + 1
+
+            level = _KW_TO_SENIORITY.get(keyword)
+            if level is not None:
+                seniority_levels.add(level)
+
+        return technologies, domain_scores, seniority_levels
+
+    def _extract_key_terms(self, text: str, technologies: set) -> Dict[str, List[str]]:
         """Extract key skills, technologies, and qualifications from text"""
-        
-        # Common patterns for extraction
-        skills_patterns = [
-            r"(?:skills? in|proficient in|experienced with|knowledge of)\s+([^.,]+)",
-            r"(?:required|required skills?|qualifications?):\s*([^.,]+)",
-        ]
-        
-        tech_pattern = r"\b(?:Python|Java|JavaScript|React|AWS|Docker|Kubernetes|SQL|NoSQL|Machine Learning|AI|TensorFlow|PyTorch)\b"
-        
+
         skills = []
-        technologies = []
         qualifications = []
-        
+
         # Extract skills from patterns
-        for pattern in skills_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _SKILLS_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 skills.extend([s.strip() for s in match.split(',')])
-        
-        # Extract technologies
-        tech_matches = re.findall(tech_pattern, text, re.IGNORECASE)
-        technologies.extend(list(set(tech_matches)))
-        
+
         # Extract qualifications (simplified)
-        qual_patterns = [r"\b(\d+\+? years? experience)\b", r"\b(Bachelor|Master|PhD)\b", r"\b(degree|certification)\b"]
-        for pattern in qual_patterns:
-            qualifications.extend(re.findall(pattern, text, re.IGNORECASE))
-        
+        for pattern in _QUAL_RES:
+            qualifications.extend(pattern.findall(text))
+
         return {
             "skills": list(set(skills))[:10],  # Limit to top 10
-            "technologies": technologies,
+            "technologies": list(technologies),
             "qualifications": qualifications
         }
-    
-    def _infer_domain(self, job_description: str, key_terms: Dict) -> str:
-        """Infer domain from job description content"""
-        domain_keywords = {
-            "software engineering": ["software", "developer", "engineer", "programming", "coding"],
-            "data science": ["data science", "machine learning", "ai", "analytics", "data analysis"],
-            "devops": ["devops", "cloud", "aws", "azure", "kubernetes", "docker", "infrastructure"],
-            "frontend": ["frontend", "react", "angular", "vue", "javascript", "ui", "ux"],
-            "backend": ["backend", "api", "server", "database", "microservices"],
-            "fullstack": ["fullstack", "full stack", "end-to-end"]
-        }
-        
-        domain_scores = {}
-        text_lower = job_description.lower()
-        
-        for domain, keywords in domain_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                domain_scores[domain] = score
-        
+
+    def _infer_domain(self, domain_scores: Dict[str, int], key_terms: Dict) -> str:
+        """Infer domain from the keyword-sweep scores plus technology hints"""
+        domain_scores = dict(domain_scores)
+
         # Also check technologies for domain hints
         for tech in key_terms.get("technologies", []):
             tech_lower = tech.lower()
-            if any(tech_lower in domain for domain in domain_keywords.keys()):
+            if any(tech_lower in domain for domain in _DOMAIN_KEYWORDS.keys()):
                 domain_scores[tech_lower] = domain_scores.get(tech_lower, 0) + 1
-        
+
         return max(domain_scores, key=domain_scores.get) if domain_scores else "general"
 
-    def _infer_seniority(self, job_description: str) -> str:
-        """Infer seniority level from job description"""
-        text_lower = job_description.lower()
-        
-        seniority_keywords = {
-            "senior": ["senior", "lead", "principal", "architect", "experienced"],
-            "mid": ["mid-level", "mid level", "intermediate"],
-            "junior": ["junior", "entry-level", "entry level", "graduate", "associate"]
-        }
-        
-        for level, keywords in seniority_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
+    def _infer_seniority(self, seniority_levels: set) -> str:
+        """Pick the seniority level from the keyword-sweep hits"""
+        for level in ("senior", "mid", "junior"):
+            if level in seniority_levels:
                 return level
-        
         return "mid"  # Default
 
     # ---------------------------------------------------------------------
@@ -156,62 +291,84 @@ class ResumeRetriever:
     
     def _retrieve_summaries_hybrid(self, jd_analysis: Dict, top_k: int) -> List[Dict]:
         """Hybrid retrieval for professional summaries - Semantic focus with domain filtering"""
-        
+
         base_filters = self._build_domain_filter(jd_analysis)
-        
-        # Primary: Semantic search
-        semantic_results = self.qdrant.client.search(
-            collection_name="professional_summaries",
-            query_vector=jd_analysis["vector"],
-            query_filter=base_filters,
-            limit=top_k * 2,  # Get more for ranking
-            with_payload=True,
-            score_threshold=0.6
-        )
-        
-        # Secondary: Keyword boost for relevant summaries
-        keyword_boosted = []
-        for skill in jd_analysis["key_skills"][:3]:
-            keyword_results = self.qdrant.client.query(
-                collection_name="professional_summaries",
-                query=skill,
-                query_filter=base_filters,
-                limit=2
+
+        # One batch RPC: the primary semantic search plus a per-skill boost
+        # request, reusing the skill vectors precomputed during JD analysis
+        skill_vectors = jd_analysis.get("skill_vectors", [])[:3]
+
+        requests = [
+            qmodels.SearchRequest(
+                vector=jd_analysis["vector"],
+                filter=base_filters,
+                limit=top_k * 2,  # Get more for ranking
+                with_payload=True,
+                score_threshold=0.6,
+                params=self._search_params
             )
-            keyword_boosted.extend(keyword_results)
-        
-        # Combine and rank
-        all_results = list(semantic_results) + keyword_boosted
+        ]
+        requests.extend(
+            qmodels.SearchRequest(
+                vector=skill_vector,
+                filter=base_filters,
+                limit=2,
+                with_payload=True,
+                params=self._search_params
+            )
+            for skill_vector in skill_vectors
+        )
+
+        batches = self._search_batch("professional_summaries", requests)
+        semantic_results = batches[0] if batches else []
+
+        # Combine and rank; chain feeds sorted() directly, no merged copy
+        all_results = chain(semantic_results, *batches[1:])
         ranked_results = self._rank_summaries(all_results, jd_analysis)
-        
+
         return ranked_results[:top_k]
     
     def _retrieve_skills_hybrid(self, jd_analysis: Dict, top_k: int) -> List[Dict]:
         """Hybrid retrieval for technical skills - Keyword primary with semantic fallback"""
         
         base_filters = self._build_domain_filter(jd_analysis)
-        all_results = []
-        
-        # Primary: Keyword matching for exact skill matches
-        for skill in jd_analysis["key_skills"][:5]:
-            keyword_results = self.qdrant.client.query(
-                collection_name="technical_skills",
-                query=skill,
-                query_filter=base_filters,
-                limit=3
+
+        # Primary: skill-term batch, reusing the vectors precomputed during
+        # JD analysis (skill matches get more slots than tech matches)
+        skill_vectors = jd_analysis.get("skill_vectors", [])
+        tech_vectors = jd_analysis.get("tech_vectors", [])
+
+        skill_requests = [
+            qmodels.SearchRequest(
+                vector=vector,
+                filter=base_filters,
+                limit=3,
+                with_payload=True,
+                params=self._search_params
             )
-            all_results.extend(keyword_results)
-        
-        # Secondary: Technology keyword matching
-        for tech in jd_analysis["key_technologies"][:5]:
-            tech_results = self.qdrant.client.query(
-                collection_name="technical_skills", 
-                query=tech,
-                query_filter=base_filters,
-                limit=2
+            for vector in skill_vectors
+        ]
+        all_results = [r for batch in self._search_batch("technical_skills", skill_requests) for r in batch]
+
+        # Short-circuit: when the skill hits alone already satisfy demand,
+        # skip the tech and semantic round trips entirely
+        ranked = self._deduplicate_skills(self._rank_skills(all_results, jd_analysis))
+        if len(ranked) >= top_k:
+            return ranked[:top_k]
+
+        # Secondary: technology-term batch
+        tech_requests = [
+            qmodels.SearchRequest(
+                vector=vector,
+                filter=base_filters,
+                limit=2,
+                with_payload=True,
+                params=self._search_params
             )
-            all_results.extend(tech_results)
-        
+            for vector in tech_vectors
+        ]
+        all_results.extend(r for batch in self._search_batch("technical_skills", tech_requests) for r in batch)
+
         # Tertiary: Semantic search for broader skill context
         if len(all_results) < top_k:
             semantic_results = self.qdrant.client.search(
@@ -219,7 +376,8 @@ class ResumeRetriever:
                 query_vector=jd_analysis["vector"],
                 query_filter=base_filters,
                 limit=top_k - len(all_results),
-                with_payload=True
+                with_payload=True,
+                search_params=self._search_params
             )
             all_results.extend(semantic_results)
         
@@ -232,32 +390,39 @@ class ResumeRetriever:
         
         # Build comprehensive experience filters
         experience_filters = self._build_experience_filters(jd_analysis)
-        
-        # Primary: Semantic search with domain context
-        semantic_results = self.qdrant.client.search(
-            collection_name="experiences",
-            query_vector=jd_analysis["vector"],
-            query_filter=experience_filters,
-            limit=top_k * 2,
-            with_payload=True,
-            score_threshold=0.65  # Higher threshold for experiences
-        )
-        
-        # Secondary: Role-specific keyword matching
-        role_boosted = []
-        for skill in jd_analysis["key_skills"][:3]:
-            role_results = self.qdrant.client.query(
-                collection_name="experiences",
-                query=skill,
-                query_filter=experience_filters,
-                limit=2
+
+        # Semantic search plus per-skill role boosts in one batch RPC, reusing
+        # the skill vectors precomputed during JD analysis
+        skill_vectors = jd_analysis.get("skill_vectors", [])[:3]
+
+        requests = [
+            qmodels.SearchRequest(
+                vector=jd_analysis["vector"],
+                filter=experience_filters,
+                limit=top_k * 2,
+                with_payload=True,
+                score_threshold=0.65,  # Higher threshold for experiences
+                params=self._search_params
             )
-            role_boosted.extend(role_results)
-        
-        # Combine and rank experiences
-        all_results = list(semantic_results) + role_boosted
+        ]
+        requests.extend(
+            qmodels.SearchRequest(
+                vector=skill_vector,
+                filter=experience_filters,
+                limit=2,
+                with_payload=True,
+                params=self._search_params
+            )
+            for skill_vector in skill_vectors
+        )
+
+        batches = self._search_batch("experiences", requests)
+        semantic_results = batches[0] if batches else []
+
+        # Combine and rank experiences; chain avoids a merged intermediate list
+        all_results = chain(semantic_results, *batches[1:])
         ranked_results = self._rank_experiences(all_results, jd_analysis)
-        
+
         return ranked_results[:top_k]
 
     # ---------------------------------------------------------------------
@@ -266,17 +431,7 @@ class ResumeRetriever:
     
     def _build_domain_filter(self, jd_analysis: Dict) -> Optional[qmodels.Filter]:
         """Build domain-based filter for all collections"""
-        if not jd_analysis.get("domain"):
-            return None
-            
-        return qmodels.Filter(
-            must=[
-                qmodels.FieldCondition(
-                    key="domain",
-                    match=qmodels.MatchValue(value=jd_analysis["domain"])
-                )
-            ]
-        )
+        return _domain_filter(jd_analysis.get("domain"))
     
     def _build_experience_filters(self, jd_analysis: Dict) -> Optional[qmodels.Filter]:
         """Build comprehensive filters for experience retrieval"""
@@ -328,7 +483,7 @@ class ResumeRetriever:
             
             # Boost for containing key skills
             text = payload.get("text", "").lower()
-            skill_matches = sum(1 for skill in jd_analysis["key_skills"] if skill.lower() in text)
+            skill_matches = sum(1 for skill in jd_analysis["key_skills_lc"] if skill in text)
             base_score *= (1 + skill_matches * 0.1)
             
             return base_score
@@ -344,14 +499,14 @@ class ResumeRetriever:
             text = payload.get("text", "").lower()
             
             # High boost for exact skill matches
-            for skill in jd_analysis["key_skills"]:
-                if skill.lower() in text:
+            for skill in jd_analysis["key_skills_lc"]:
+                if skill in text:
                     base_score *= 1.5
                     break
-            
+
             # Boost for technology matches
-            for tech in jd_analysis["key_technologies"]:
-                if tech.lower() in text:
+            for tech in jd_analysis["key_technologies_lc"]:
+                if tech in text:
                     base_score *= 1.3
                     break
             
@@ -373,17 +528,17 @@ class ResumeRetriever:
             
             # Role matching boost
             experience_role = payload.get("experience_role", "").lower()
-            for skill in jd_analysis["key_skills"]:
-                if skill.lower() in experience_role:
+            for skill in jd_analysis["key_skills_lc"]:
+                if skill in experience_role:
                     base_score *= 1.4
                     break
-            
+
             # Skill mentions in experience text
-            skill_matches = sum(1 for skill in jd_analysis["key_skills"] if skill.lower() in text)
+            skill_matches = sum(1 for skill in jd_analysis["key_skills_lc"] if skill in text)
             base_score *= (1 + skill_matches * 0.15)
-            
+
             # Technology mentions
-            tech_matches = sum(1 for tech in jd_analysis["key_technologies"] if tech.lower() in text)
+            tech_matches = sum(1 for tech in jd_analysis["key_technologies_lc"] if tech in text)
             base_score *= (1 + tech_matches * 0.1)
             
             # Domain match
@@ -400,17 +555,19 @@ class ResumeRetriever:
     
     def _rank_and_deduplicate_results(self, collection_results: Dict, jd_analysis: Dict) -> Dict[str, List]:
         """Apply cross-collection ranking and deduplication"""
-        
-        # Flatten all results for cross-collection ranking
-        all_results = []
-        for collection_name, results in collection_results.items():
-            for result in results:
-                all_results.append({
-                    "collection": collection_name,
-                    "result": result,
-                    "cross_score": self._calculate_cross_relevance_score(result, jd_analysis, collection_name)
-                })
-        
+
+        # Flatten all results, then score the whole batch at once
+        flat = [
+            (collection_name, result)
+            for collection_name, results in collection_results.items()
+            for result in results
+        ]
+        cross_scores = self._cross_relevance_scores(flat, jd_analysis)
+        all_results = [
+            {"collection": collection_name, "result": result, "cross_score": score}
+            for (collection_name, result), score in zip(flat, cross_scores)
+        ]
+
         # Sort by cross-collection relevance
         all_results.sort(key=lambda x: x["cross_score"], reverse=True)
         
@@ -432,64 +589,105 @@ class ResumeRetriever:
         
         return final_results
     
-    def _calculate_cross_relevance_score(self, result, jd_analysis: Dict, collection: str) -> float:
-        """Calculate unified relevance score across all collections"""
-        
-        base_score = getattr(result, 'score', 0.5)
-        payload = result.payload
-        text = payload.get("text", "").lower()
-        
-        # Collection-specific weights
-        collection_weights = {
-            "experiences": 1.2,        # Experiences are most valuable
-            "professional_summaries": 1.1,  # Summaries are important
-            "technical_skills": 1.0     # Skills are baseline
-        }
-        
-        base_score *= collection_weights.get(collection, 1.0)
-        
-        # Domain match boost (applies to all collections)
-        if payload.get("domain") == jd_analysis.get("domain"):
-            base_score *= 1.25
-        
-        # Skill relevance boost
-        skill_relevance = sum(1 for skill in jd_analysis["key_skills"] if skill.lower() in text)
-        base_score *= (1 + skill_relevance * 0.1)
-        
-        return base_score
+    # Collection-specific weights for cross-collection ranking
+    _COLLECTION_WEIGHTS = {
+        "experiences": 1.2,             # Experiences are most valuable
+        "professional_summaries": 1.1,  # Summaries are important
+        "technical_skills": 1.0         # Skills are baseline
+    }
+
+    def _cross_relevance_scores(self, flat: List[Tuple[str, Any]], jd_analysis: Dict) -> List[float]:
+        """
+        Unified relevance scores for a flattened (collection, result) batch.
+
+        Skills are counted per text with the same substring checks as the
+        old per-result loop, memoized per unique text, and the score formula
+        runs as vectorized NumPy arithmetic over the whole batch instead of
+        nested Python loops per result.
+        """
+        if not flat:
+            return []
+
+        texts = [result.payload.get("text", "").lower() for _, result in flat]
+
+        skills_lc = jd_analysis.get("key_skills_lc", [])
+        if skills_lc:
+            # Per-skill containment, exactly as the old loop counted: a regex
+            # alternation undercounts nested skills ("java" consumes the
+            # match inside "javascript", "sql" inside "mysql"). JD skill
+            # lists are short, and duplicate texts share one count.
+            counts_by_text: Dict[str, int] = {}
+            for text in texts:
+                if text not in counts_by_text:
+                    counts_by_text[text] = sum(1 for skill in skills_lc if skill in text)
+            skill_counts = np.array(
+                [counts_by_text[text] for text in texts],
+                dtype=np.float32
+            )
+        else:
+            skill_counts = np.zeros(len(texts), dtype=np.float32)
+
+        base_scores = np.array(
+            [getattr(result, 'score', 0.5) for _, result in flat],
+            dtype=np.float32
+        )
+        weights = np.array(
+            [self._COLLECTION_WEIGHTS.get(collection, 1.0) for collection, _ in flat],
+            dtype=np.float32
+        )
+        jd_domain = jd_analysis.get("domain")
+        domain_boost = np.where(
+            np.array([result.payload.get("domain") == jd_domain for _, result in flat]),
+            1.25, 1.0
+        ).astype(np.float32)
+
+        scores = base_scores * weights * domain_boost * (1.0 + 0.1 * skill_counts)
+        return scores.tolist()
     
-    def _create_content_fingerprint(self, result) -> str:
+    def _create_content_fingerprint(self, result) -> Tuple[str, bytes]:
         """Create fingerprint for deduplication"""
         payload = result.payload
         text = payload.get("text", "").lower()
-        
-        # Create a simplified fingerprint (first 50 chars + collection)
+
+        # Hash the full text: a 50-char prefix key collapses distinct entries
+        # that share a template opening, and the short digest keeps set
+        # lookups cheap regardless of text length
         collection = getattr(result, 'collection', 'unknown')
-        return f"{collection}:{text[:50]}"
+        return (collection, hashlib.blake2b(text.encode(), digest_size=8).digest())
     
     def _deduplicate_skills(self, skills_results: List) -> List:
         """Specialized deduplication for technical skills"""
-        seen_skills = set()
+        # Token -> indices of kept skills containing that token. A new skill
+        # only needs comparing against kept entries that share a token with
+        # it, which keeps duplicate detection near-linear instead of scanning
+        # every seen skill per result.
+        token_to_idx: Dict[str, List[int]] = {}
+        kept_token_sets: List[set] = []
         deduplicated = []
-        
-        for result in skills_results:
-            skill_text = result.payload.get("text", "").lower().strip()
-            
-            # Normalize skill text for comparison
-            normalized = re.sub(r'[^\w\s]', '', skill_text)
-            words = normalized.split()
-            
-            # Check if this is a duplicate of a previously seen skill
-            is_duplicate = False
-            for seen in seen_skills:
-                if any(word in seen for word in words) or any(seen_word in normalized for seen_word in seen.split()):
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                seen_skills.add(normalized)
-                deduplicated.append(result)
-        
+
+        # Normalize every skill text up-front with the precompiled pattern -
+        # one tight pass instead of a regex invocation inside the dedup loop
+        token_sets = [
+            set(_NON_WORD_RE.sub('', result.payload.get("text", "").lower().strip()).split())
+            for result in skills_results
+        ]
+
+        for result, tokens in zip(skills_results, token_sets):
+            candidates = set()
+            for token in tokens:
+                candidates.update(token_to_idx.get(token, ()))
+
+            # Any shared token marks a duplicate (same semantics as the old
+            # substring scan for whole-word overlaps)
+            if candidates:
+                continue
+
+            idx = len(kept_token_sets)
+            kept_token_sets.append(tokens)
+            for token in tokens:
+                token_to_idx.setdefault(token, []).append(idx)
+            deduplicated.append(result)
+
         return deduplicated
 
     # ---------------------------------------------------------------------
@@ -1,10 +1,14 @@
 import re
 from collections import Counter
+from functools import lru_cache
 import spacy
 from wordfreq import zipf_frequency
 
-# Load SpaCy model
-nlp = spacy.load("en_core_web_sm")
+_ACRONYM_RE = re.compile(r"[A-Z0-9\-\.]{2,}")
+
+# Load SpaCy model; NER is never used here, and skipping it cuts a large
+# share of per-document pipeline cost
+nlp = spacy.load("en_core_web_sm", disable=["ner"])
 
 # English + job boilerplate stopwords
 STOPWORDS = set(nlp.Defaults.stop_words).union({
@@ -15,7 +19,12 @@ STOPWORDS = set(nlp.Defaults.stop_words).union({
 })
 
 def is_acronym(token):
-    return bool(re.fullmatch(r"[A-Z0-9\-\.]{2,}", token))
+    return bool(_ACRONYM_RE.fullmatch(token))
+
+@lru_cache(maxsize=65536)
+def _zipf(word):
+    """Cached wordfreq lookup; terms repeat heavily within and across JDs."""
+    return zipf_frequency(word, "en")
 
 def is_common_word(word):
     """
@@ -23,10 +32,12 @@ def is_common_word(word):
     Common English words have Zipf >= 4.0 typically.
     Technical terms tend to have low frequency.
     """
-    return zipf_frequency(word.lower(), "en") >= 4.0
+    return _zipf(word.lower()) >= 4.0
 
 def extract_candidates(text):
-    doc = nlp(text)
+    return _candidates_from_doc(nlp(text))
+
+def _candidates_from_doc(doc):
     candidates = []
 
     for token in doc:
@@ -48,8 +59,9 @@ def extract_candidates(text):
     return candidates
 
 def score_terms(candidates):
-    # Count frequency in the JD
-    freq = Counter([c for c in candidates])
+    # Count frequency in the JD; Counter consumes the iterable directly,
+    # no intermediate list
+    freq = Counter(candidates)
 
     scored = {}
     for term, count in freq.items():
@@ -80,3 +92,17 @@ def extract_keywords(text, min_score=0.9):
     sorted_terms = sorted(scored.items(), key=lambda x: x[1], reverse=True)
 
     return [term.lower() for term, score in sorted_terms if score >= min_score]
+
+
+def extract_keywords_batch(texts, min_score=0.9):
+    """
+    Keyword extraction over many texts at once. nlp.pipe batches the C-level
+    tokenization/parsing across documents, which is far cheaper than calling
+    nlp(text) in a Python loop. Returns one keyword list per input text.
+    """
+    results = []
+    for doc in nlp.pipe(texts, batch_size=32):
+        scored = score_terms(_candidates_from_doc(doc))
+        sorted_terms = sorted(scored.items(), key=lambda x: x[1], reverse=True)
+        results.append([term.lower() for term, score in sorted_terms if score >= min_score])
+    return results
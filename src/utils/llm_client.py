@@ -3,6 +3,7 @@ Utility module for creating OpenAI-compatible clients for RunPod vLLM servers.
 """
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from openai import OpenAI
 from typing import Optional
@@ -18,8 +19,15 @@ logger = get_logger(__name__)
 _cached_openai_client: Optional[OpenAI] = None
 
 
+@lru_cache(maxsize=1)
 def load_llm_config() -> dict:
-    """Load the raw llm_config from config.yaml"""
+    """
+    Load the raw llm_config from config.yaml.
+
+    Cached: client construction resolves provider, model and endpoint through
+    this several times, and the file does not change at runtime. Call
+    load_llm_config.cache_clear() if a hot reload is ever needed.
+    """
     config_path = Path(__file__).parent.parent / "core" / "config.yaml"
     with open(config_path, "r") as f:
         config = yaml.safe_load(f)
@@ -39,18 +47,23 @@ def get_provider_config(provider: Optional[str] = None) -> dict:
     Get the configuration for a specific provider, or the current one if not specified.
     Returns a merged dictionary with global settings and provider-specific overrides.
     """
-    llm_config = load_llm_config()
     if provider is None:
         provider = get_current_provider()
-    
+    return _merged_provider_config(provider)
+
+
+@lru_cache(maxsize=8)
+def _merged_provider_config(provider: str) -> dict:
+    """Merge global llm_config with a provider's overrides, once per provider."""
+    llm_config = load_llm_config()
     provider_settings = llm_config.get(provider, {})
-    
+
     # Create a merged config so top-level settings like SUMMARY_MAX_TOKENS are available
     merged_config = llm_config.copy()
     # Remove the provider sections from the top level to avoid confusion
     if "runpod" in merged_config: del merged_config["runpod"]
     if "groq" in merged_config: del merged_config["groq"]
-    
+
     # Update with provider-specific overrides
     merged_config.update(provider_settings)
     return merged_config
@@ -67,7 +80,7 @@ def get_openai_client() -> OpenAI:
         return _cached_openai_client
     
     provider = get_current_provider()
-    logger.info(f"Initializing OpenAI client for provider: {provider}")
+    logger.info("Initializing OpenAI client for provider: %s", provider)
     
     config = get_provider_config(provider)
 
@@ -94,7 +107,7 @@ def get_openai_client() -> OpenAI:
     # Ensure base_url doesn't have trailing slash
     base_url = base_url.rstrip('/')
     
-    logger.info(f"Using {provider} endpoint: {base_url}")
+    logger.info("Using %s endpoint: %s", provider, base_url)
     
     _cached_openai_client = OpenAI(
         base_url=base_url,
@@ -104,9 +117,13 @@ def get_openai_client() -> OpenAI:
     return _cached_openai_client
 
 
+@lru_cache(maxsize=1)
 def get_llm_model() -> str:
     """
     Get the LLM model name for the current provider.
+
+    Cached: the result depends only on env and config, both fixed for the
+    process lifetime, and callers resolve it before every request.
     """
     provider = get_current_provider()
     config = get_provider_config(provider)
@@ -9,6 +9,10 @@ class ProjectLogger:
     def __init__(self, default_pipeline="app"):
         self.base_path = Path(__file__).resolve().parents[2]
         self.default_pipeline = default_pipeline
+        # Pipelines whose handlers are already configured; prevents every
+        # get_logger call from tearing down and re-opening the rotating
+        # file handlers
+        self._configured = set()
         self.setup_logging()
     
     def setup_logging(self, pipeline_name=None):
@@ -74,12 +78,14 @@ class ProjectLogger:
         logging.getLogger("requests").setLevel(logging.WARNING)
         logging.getLogger("selenium").setLevel(logging.WARNING)
         
+        self._configured.add(pipeline_name)
+
         logger = logging.getLogger(__name__)
         logger.info(f"Logging configured for pipeline: {pipeline_name}")
-    
+
     def get_logger(self, name, pipeline_name=None):
         """Get a logger instance, optionally for specific pipeline."""
-        if pipeline_name and pipeline_name != self.default_pipeline:
+        if pipeline_name and pipeline_name not in self._configured:
             self.setup_logging(pipeline_name)
         return logging.getLogger(name)
 
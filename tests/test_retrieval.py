@@ -97,7 +97,7 @@ async def diagnose_qdrant_collection(
         
         # Embed job description
         jd_vecs = qdrant_manager.embedding_service.encode_texts([job_description])
-        if not jd_vecs or len(jd_vecs) == 0:
+        if len(jd_vecs) == 0:
             print("⚠️  Failed to embed job description")
             return
         